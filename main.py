@@ -13,9 +13,13 @@ from SelectionSetManager.ui import SelectionSetUI
 def show_ui():
     """Show the Selection Set Manager UI"""
     # Close existing UI if it exists
-    for widget in QtWidgets.QApplication.allWidgets():
-        if isinstance(widget, SelectionSetUI):
-            widget.close()
+    existing = SelectionSetUI._instance
+    if existing is not None:
+        try:
+            existing.close()
+        except RuntimeError:
+            # The underlying C++ widget was already deleted
+            SelectionSetUI._instance = None
     
     # Create and show new UI
     ui = SelectionSetUI()
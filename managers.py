@@ -7,31 +7,168 @@ all the logical operations of sets and groups.
 """
 
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 import json
 import os
+import sys
 import base64
+import pickle
+from itertools import product
+
+# orjson is optional, it serializes large set libraries several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
+else:
+    def _dumps(data):
+        return json.dumps(data, indent=4).encode('utf-8')
+    _loads = json.loads
+
+# Default display properties for new sets and groups. Positions, sizes and
+# colors are stored as tuples and replaced whole on update.
+SET_DEFAULT_COLOR = (70, 70, 70)
+SET_DEFAULT_SIZE = (200, 150)
+GROUP_DEFAULT_COLOR = (100, 100, 60)  # Yellowish
+GROUP_DEFAULT_SIZE = (300, 200)  # Larger than sets
+DEFAULT_TRANSPARENCY = 180  # 0-255
+
+# Extension of the binary (pickle) set file format
+BINARY_SET_EXT = ".sset"
+
+# Raw bytes per base64 chunk when exporting the background image. A
+# multiple of 3 so no padding is emitted mid-stream.
+_IMAGE_CHUNK_SIZE = 57 * 1024
+# Stand-in for the image data in the JSON text, replaced while writing
+_IMAGE_DATA_PLACEHOLDER = "__selset_background_image_data__"
+
+# Channel filter keys in display order
+CHANNELS = ("tx", "ty", "tz", "rx", "ry", "rz")
+# One bit per channel in SelectionSetManager._channel_mask
+_CHANNEL_BITS = {channel: 1 << i for i, channel in enumerate(CHANNELS)}
+_ALL_CHANNELS_MASK = (1 << len(CHANNELS)) - 1
+
+
+class SetRecord(object):
+    """All data stored for a single selection set"""
+    
+    __slots__ = ('objects', 'pos', 'color', 'size', 'transparency', 'parent')
+    
+    def __init__(self, objects, pos, color=None, size=None,
+                 transparency=DEFAULT_TRANSPARENCY, parent=None):
+        self.objects = objects  # Long names of the objects in the set
+        self.pos = pos  # Widget position (x, y)
+        self.color = color if color is not None else SET_DEFAULT_COLOR  # (r, g, b)
+        self.size = size if size is not None else SET_DEFAULT_SIZE  # (width, height)
+        self.transparency = transparency  # Background alpha (0-255)
+        self.parent = parent  # Name of the parent set, or None
+
+
+class GroupRecord(object):
+    """All data stored for a single parent group"""
+    
+    __slots__ = ('sets', 'pos', 'color', 'size', 'transparency')
+    
+    def __init__(self, sets, pos, color=None, size=None,
+                 transparency=DEFAULT_TRANSPARENCY):
+        self.sets = sets  # Names of the sets in the group, an ordered {set_name: None}
+        self.pos = pos  # Widget position (x, y)
+        self.color = color if color is not None else GROUP_DEFAULT_COLOR  # (r, g, b)
+        self.size = size if size is not None else GROUP_DEFAULT_SIZE  # (width, height)
+        self.transparency = transparency  # Background alpha (0-255)
+
+
+def _grow_max_pos(max_pos, pos):
+    """Grow a cached [max_x, max_y] in place to include pos"""
+    if pos[0] > max_pos[0]:
+        max_pos[0] = pos[0]
+    if pos[1] > max_pos[1]:
+        max_pos[1] = pos[1]
+
+
+class _SetFileUnpickler(pickle.Unpickler):
+    """Unpickler that only accepts plain data (dicts, lists, strings, numbers)
+    
+    Set files never contain class instances, refusing every global lookup
+    stops a crafted file from running code on load.
+    """
+    
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(
+            f"Set files may only contain plain data, found {module}.{name}")
+
+
+def _existing_nodes(names, **kwargs):
+    """Return the names that exist in the scene using a single cmds.ls call"""
+    # cmds.ls with an empty list would list the whole scene
+    if not names:
+        return []
+    return cmds.ls(names, **kwargs) or []
+
 
 class SelectionSetManager:
     """Core class for managing selection sets"""
     
     def __init__(self):
-        self.sets = {}  # Dictionary to store sets: {set_name: [object1, object2, ...]}
-        self.set_positions = {}  # Dictionary to store set widget positions
-        self.set_colors = {}  # Dictionary to store set colors
-        self.set_sizes = {}  # Dictionary to store set sizes
-        self.set_transparency = {}  # Dictionary to store set transparency
-        self.set_parents = {}  # Dictionary to store parent-child relationships
+        self.sets = {}  # Dictionary to store sets: {set_name: SetRecord}
         self.background_image = None  # Path to background image
         self.active_channels = {  # Dictionary to track active channels
             "tx": True, "ty": True, "tz": True,
             "rx": True, "ry": True, "rz": True
         }
+        self._sync_channel_mask()
         # Parent groups
-        self.parent_groups = {}  # Dictionary to store parent groups: {group_name: [set_name1, set_name2, ...]}
-        self.group_positions = {}  # Dictionary to store parent group positions
-        self.group_colors = {}  # Dictionary to store parent group colors
-        self.group_sizes = {}  # Dictionary to store parent group sizes
-        self.group_transparency = {}  # Dictionary to store parent group transparency
+        self.parent_groups = {}  # Dictionary to store parent groups: {group_name: GroupRecord}
+        # Largest x/y seen per kind, used to place new widgets. Only grows;
+        # after a delete it may be stale, which is fine for a placement hint.
+        self._max_set_pos = [0, 0]
+        self._max_group_pos = [0, 0]
+        # Reverse parent index: {parent_set_name: [child_set_name, ...]}, read
+        # by the workspace to find the children of a moved set
+        self.set_children = {}
+        # Flattened hierarchy objects per root set, see get_all_objects_in_set_hierarchy
+        self._hier_cache = {}
+        # Existing objects per root set, filled on first selection and
+        # cleared by the scene callbacks below whenever nodes change
+        self._validated = {}
+        self._callback_ids = []
+        self.add_callbacks()
+        # Owning group per grouped set: {set_name: group_name}
+        self._set_to_group = {}
+    
+    def add_callbacks(self):
+        """Register scene callbacks that invalidate the validated object lists
+        
+        Does nothing while they are registered. The validated lists are
+        dropped, the scene may have changed while nothing was watching.
+        """
+        if self._callback_ids:
+            return
+        clear = self._clear_validated
+        clear()
+        self._callback_ids = [
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, clear),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, clear),
+            om.MDGMessage.addNodeAddedCallback(clear, "dependNode"),
+            om.MDGMessage.addNodeRemovedCallback(clear, "dependNode"),
+            om.MEventMessage.addEventCallback("NameChanged", clear),
+            om.MDagMessage.addAllDagChangesCallback(clear),
+        ]
+    
+    def remove_callbacks(self):
+        """Remove the scene callbacks, call when the manager is hidden or discarded"""
+        if self._callback_ids:
+            om.MMessage.removeCallbacks(self._callback_ids)
+            self._callback_ids = []
+    
+    def _clear_validated(self, *args):
+        """Scene callback, forget which objects were found to exist"""
+        self._validated.clear()
     
     def create_parent_group(self, name="ParentGroup"):
         """Create a new parent group container (not a selection set)"""
@@ -42,27 +179,19 @@ class SelectionSetManager:
             group_name = f"{name}_{counter}"
             counter += 1
         
-        # Initialize the parent group with an empty list of sets
-        self.parent_groups[group_name] = []
-        
         # Initialize position at (0,0) or offset from last group/set
-        if self.group_positions:
+        if self.parent_groups:
             # Get the last position and add an offset
-            last_x = max(pos[0] for pos in self.group_positions.values())
-            last_y = max(pos[1] for pos in self.group_positions.values())
-            self.group_positions[group_name] = [last_x + 20, last_y + 20]
-        elif self.set_positions:
+            pos = (self._max_group_pos[0] + 20, self._max_group_pos[1] + 20)
+        elif self.sets:
             # Use the last set position as reference
-            last_x = max(pos[0] for pos in self.set_positions.values())
-            last_y = max(pos[1] for pos in self.set_positions.values())
-            self.group_positions[group_name] = [last_x + 20, last_y + 20]
+            pos = (self._max_set_pos[0] + 20, self._max_set_pos[1] + 20)
         else:
-            self.group_positions[group_name] = [20, 20]
+            pos = (20, 20)
+        _grow_max_pos(self._max_group_pos, pos)
         
-        # Initialize default properties
-        self.group_colors[group_name] = [100, 100, 60]  # Default color (yellowish)
-        self.group_sizes[group_name] = [300, 200]  # Default size (larger than sets)
-        self.group_transparency[group_name] = 180  # Default transparency
+        # Initialize the parent group with no sets and default properties
+        self.parent_groups[group_name] = GroupRecord({}, pos)
         
         return group_name
     
@@ -72,18 +201,21 @@ class SelectionSetManager:
             cmds.warning(f"Set '{set_name}' not found.")
             return False
         
-        if group_name not in self.parent_groups:
+        group = self.parent_groups.get(group_name)
+        if group is None:
             cmds.warning(f"Parent group '{group_name}' not found.")
             return False
         
-        # Remove from other groups first
-        for other_group, sets in self.parent_groups.items():
-            if set_name in sets:
-                sets.remove(set_name)
+        # Remove from the previous group first
+        old_group_name = self._set_to_group.get(set_name)
+        if old_group_name == group_name:
+            return True
+        if old_group_name is not None:
+            del self.parent_groups[old_group_name].sets[set_name]
         
         # Add to the specified group
-        if set_name not in self.parent_groups[group_name]:
-            self.parent_groups[group_name].append(set_name)
+        group.sets[set_name] = None
+        self._set_to_group[set_name] = group_name
         
         return True
     
@@ -94,102 +226,98 @@ class SelectionSetManager:
             return False
         
         if group_name is not None:
-            if group_name not in self.parent_groups:
+            group = self.parent_groups.get(group_name)
+            if group is None:
                 cmds.warning(f"Parent group '{group_name}' not found.")
                 return False
             
-            if set_name in self.parent_groups[group_name]:
-                self.parent_groups[group_name].remove(set_name)
+            if self._set_to_group.get(set_name) == group_name:
+                del group.sets[set_name]
+                del self._set_to_group[set_name]
         else:
-            # Remove from all groups
-            for group_name, sets in self.parent_groups.items():
-                if set_name in sets:
-                    sets.remove(set_name)
+            # Remove from whichever group holds it
+            old_group_name = self._set_to_group.pop(set_name, None)
+            if old_group_name is not None:
+                del self.parent_groups[old_group_name].sets[set_name]
         
         return True
     
+    def group_of(self, set_name):
+        """Name of the parent group holding a set, or None"""
+        return self._set_to_group.get(set_name)
+    
     def rename_parent_group(self, old_name, new_name):
         """Rename a parent group"""
-        if old_name not in self.parent_groups:
-            cmds.warning(f"Parent group '{old_name}' not found.")
-            return False
-        
         if new_name in self.parent_groups:
             cmds.warning(f"Parent group named '{new_name}' already exists.")
             return False
         
-        # Update all dictionaries
-        self.parent_groups[new_name] = self.parent_groups[old_name]
-        
-        if old_name in self.group_positions:
-            self.group_positions[new_name] = self.group_positions[old_name]
-            del self.group_positions[old_name]
-        
-        if old_name in self.group_colors:
-            self.group_colors[new_name] = self.group_colors[old_name]
-            del self.group_colors[old_name]
-        
-        if old_name in self.group_sizes:
-            self.group_sizes[new_name] = self.group_sizes[old_name]
-            del self.group_sizes[old_name]
-        
-        if old_name in self.group_transparency:
-            self.group_transparency[new_name] = self.group_transparency[old_name]
-            del self.group_transparency[old_name]
+        # Move the record, it carries all of the group's properties
+        try:
+            self.parent_groups[new_name] = self.parent_groups.pop(old_name)
+        except KeyError:
+            cmds.warning(f"Parent group '{old_name}' not found.")
+            return False
         
-        del self.parent_groups[old_name]
+        # Point the member sets at the new name
+        for set_name in self.parent_groups[new_name].sets:
+            self._set_to_group[set_name] = new_name
         return True
     
     def delete_parent_group(self, name):
         """Delete a parent group"""
-        if name not in self.parent_groups:
+        # Remove the group record
+        group = self.parent_groups.pop(name, None)
+        if group is None:
             cmds.warning(f"Parent group '{name}' not found.")
             return False
         
-        # Remove the group from all dictionaries
-        del self.parent_groups[name]
-        
-        if name in self.group_positions:
-            del self.group_positions[name]
-        
-        if name in self.group_colors:
-            del self.group_colors[name]
-        
-        if name in self.group_sizes:
-            del self.group_sizes[name]
-        
-        if name in self.group_transparency:
-            del self.group_transparency[name]
-        
+        # Its sets are no longer grouped
+        for set_name in group.sets:
+            self._set_to_group.pop(set_name, None)
         return True
     
     def update_group_position(self, name, x, y):
         """Update the position of a parent group"""
-        if name in self.parent_groups:
-            self.group_positions[name] = [x, y]
+        rec = self.parent_groups.get(name)
+        if rec is None:
+            return False
+        # Drags often report the same position again
+        if rec.pos == (x, y):
             return True
-        return False
+        rec.pos = (x, y)
+        _grow_max_pos(self._max_group_pos, rec.pos)
+        return True
     
     def update_group_size(self, name, width, height):
         """Update the size of a parent group"""
-        if name in self.parent_groups:
-            self.group_sizes[name] = [width, height]
+        rec = self.parent_groups.get(name)
+        if rec is None:
+            return False
+        if rec.size == (width, height):
             return True
-        return False
+        rec.size = (width, height)
+        return True
     
     def update_group_color(self, name, r, g, b):
         """Update the color of a parent group"""
-        if name in self.parent_groups:
-            self.group_colors[name] = [r, g, b]
+        rec = self.parent_groups.get(name)
+        if rec is None:
+            return False
+        if rec.color == (r, g, b):
             return True
-        return False
+        rec.color = (r, g, b)
+        return True
     
     def update_group_transparency(self, name, transparency):
         """Update the transparency of a parent group"""
-        if name in self.parent_groups:
-            self.group_transparency[name] = transparency
+        rec = self.parent_groups.get(name)
+        if rec is None:
+            return False
+        if rec.transparency == transparency:
             return True
-        return False
+        rec.transparency = transparency
+        return True
     
     def create_set(self, name="NewSet"):
         """Create a new selection set from current selection"""
@@ -205,96 +333,81 @@ class SelectionSetManager:
             set_name = f"{name}_{counter}"
             counter += 1
         
-        self.sets[set_name] = selection
         # Initialize position at (0,0) or offset from last set
-        if self.set_positions:
+        if self.sets:
             # Get the last position and add an offset
-            last_x = max(pos[0] for pos in self.set_positions.values())
-            last_y = max(pos[1] for pos in self.set_positions.values())
-            self.set_positions[set_name] = [last_x + 20, last_y + 20]
+            pos = (self._max_set_pos[0] + 20, self._max_set_pos[1] + 20)
         else:
-            self.set_positions[set_name] = [20, 20]
+            pos = (20, 20)
+        _grow_max_pos(self._max_set_pos, pos)
         
-        # Initialize default properties
-        self.set_colors[set_name] = [70, 70, 70]  # Default color
-        self.set_sizes[set_name] = [200, 150]  # Default size
-        self.set_transparency[set_name] = 180  # Default transparency (0-255)
-        self.set_parents[set_name] = None  # No parent by default
+        # Default properties, no parent by default
+        self.sets[set_name] = SetRecord(selection, pos)
             
         return set_name
     
     def rename_set(self, old_name, new_name):
         """Rename a selection set"""
-        if old_name not in self.sets:
-            cmds.warning(f"Set '{old_name}' not found.")
-            return False
-        
         if new_name in self.sets:
             cmds.warning(f"Set named '{new_name}' already exists.")
             return False
         
-        # Update all dictionaries
-        self.sets[new_name] = self.sets[old_name]
-        if old_name in self.set_positions:
-            self.set_positions[new_name] = self.set_positions[old_name]
-            del self.set_positions[old_name]
-        if old_name in self.set_colors:
-            self.set_colors[new_name] = self.set_colors[old_name]
-            del self.set_colors[old_name]
-        if old_name in self.set_sizes:
-            self.set_sizes[new_name] = self.set_sizes[old_name]
-            del self.set_sizes[old_name]
-        if old_name in self.set_transparency:
-            self.set_transparency[new_name] = self.set_transparency[old_name]
-            del self.set_transparency[old_name]
-        
-        # Update parent-child relationships
-        if old_name in self.set_parents:
-            self.set_parents[new_name] = self.set_parents[old_name]
-            del self.set_parents[old_name]
+        # Move the record, it carries all of the set's properties
+        try:
+            self.sets[new_name] = self.sets.pop(old_name)
+        except KeyError:
+            cmds.warning(f"Set '{old_name}' not found.")
+            return False
         
         # Update any child references to this set
-        for child_name, parent_name in self.set_parents.items():
-            if parent_name == old_name:
-                self.set_parents[child_name] = new_name
-        
-        # Update any group references
-        for group_name, sets in self.parent_groups.items():
-            if old_name in sets:
-                sets.remove(old_name)
-                sets.append(new_name)
+        children = self.set_children.pop(old_name, None)
+        if children:
+            self.set_children[new_name] = children
+            for child_name in children:
+                self.sets[child_name].parent = new_name
+        
+        # Update the parent's child list
+        parent_name = self.sets[new_name].parent
+        if parent_name is not None:
+            siblings = self.set_children[parent_name]
+            siblings[siblings.index(old_name)] = new_name
+        
+        # Cached hierarchies are keyed and built by name
+        self._hier_cache.clear()
+        self._validated.clear()
+        
+        # Update the group reference
+        group_name = self._set_to_group.pop(old_name, None)
+        if group_name is not None:
+            group_sets = self.parent_groups[group_name].sets
+            del group_sets[old_name]
+            group_sets[new_name] = None
+            self._set_to_group[new_name] = group_name
         
-        del self.sets[old_name]
         return True
     
     def delete_set(self, name):
         """Delete a selection set"""
-        if name in self.sets:
-            # Remove from all dictionaries
-            del self.sets[name]
-            if name in self.set_positions:
-                del self.set_positions[name]
-            if name in self.set_colors:
-                del self.set_colors[name]
-            if name in self.set_sizes:
-                del self.set_sizes[name]
-            if name in self.set_transparency:
-                del self.set_transparency[name]
-            
-            # Update parent-child relationships
-            if name in self.set_parents:
-                del self.set_parents[name]
-            
-            # Update any child references to this set
-            for child_name, parent_name in list(self.set_parents.items()):
-                if parent_name == name:
-                    self.set_parents[child_name] = None
-            
-            # Remove from any parent groups
-            self.remove_set_from_group(name)
-            
-            return True
-        return False
+        rec = self.sets.get(name)
+        if rec is None:
+            return False
+        
+        # Remove the set record
+        self._invalidate_hierarchy(name)
+        del self.sets[name]
+        
+        # Remove from its parent group
+        group_name = self._set_to_group.pop(name, None)
+        if group_name is not None:
+            del self.parent_groups[group_name].sets[name]
+        
+        # Detach from the parent and orphan any children of this set
+        if rec.parent is not None:
+            self.set_children[rec.parent].remove(name)
+        for child_name in self.set_children.pop(name, ()):
+            self.sets[child_name].parent = None
+        
+        return True
     
     def select_set(self, name, respect_channels=True):
         """Select all objects in a set and its children"""
@@ -302,11 +415,13 @@ class SelectionSetManager:
             cmds.warning(f"Set '{name}' not found.")
             return False
         
-        # Collect all objects to select, including from child sets
-        all_objects = self.get_all_objects_in_set_hierarchy(name)
-        
-        # Filter out objects that no longer exist
-        valid_objects = [obj for obj in all_objects if cmds.objExists(obj)]
+        # Objects that still exist, including from child sets. Validated
+        # on first use and kept until the scene changes.
+        valid_objects = self._validated.get(name)
+        if valid_objects is None:
+            all_objects = self.get_all_objects_in_set_hierarchy(name)
+            valid_objects = _existing_nodes(all_objects, long=True)
+            self._validated[name] = valid_objects
         
         if not valid_objects:
             cmds.warning(f"No valid objects found in set '{name}' or its children.")
@@ -321,59 +436,65 @@ class SelectionSetManager:
         return True
     
     def get_all_objects_in_set_hierarchy(self, set_name):
-        """Get all objects in a set and its child sets recursively"""
+        """Get all objects in a set and its child sets recursively
+        
+        The result is cached per set until the set or one of its
+        descendants changes, treat it as read-only.
+        """
+        cached = self._hier_cache.get(set_name)
+        if cached is not None:
+            return cached
         if set_name not in self.sets:
             return []
         
-        # Start with objects in this set
-        all_objects = list(self.sets[set_name])
-        
-        # Add objects from all child sets
-        for child_name, parent_name in self.set_parents.items():
-            if parent_name == set_name:
-                all_objects.extend(self.get_all_objects_in_set_hierarchy(child_name))
-        
+        # Depth-first walk over the child index, parents before children
+        all_objects = []
+        visited = set()
+        stack = [set_name]
+        while stack:
+            name = stack.pop()
+            if name in visited:
+                continue
+            visited.add(name)
+            all_objects.extend(self.sets[name].objects)
+            stack.extend(reversed(self.set_children.get(name, ())))
+        
+        self._hier_cache[set_name] = all_objects
         return all_objects
     
+    def _invalidate_hierarchy(self, set_name):
+        """Drop cached hierarchies that include the given set"""
+        # A set's objects are part of its own result and of every ancestor's
+        name = set_name
+        visited = set()
+        while name is not None and name not in visited:
+            visited.add(name)
+            self._hier_cache.pop(name, None)
+            self._validated.pop(name, None)
+            rec = self.sets.get(name)
+            name = rec.parent if rec is not None else None
+    
     def select_objects_with_channel_filtering(self, objects):
         """Select objects with channel filtering applied"""
         if not objects:
             return
         
         # If all channels are active or none are active, just do a normal select
-        if all(self.active_channels.values()) or not any(self.active_channels.values()):
+        if self._channel_mask in (0, _ALL_CHANNELS_MASK):
             cmds.select(objects, replace=True)
             return
         
-        # Clear selection
-        cmds.select(clear=True)
-        
-        # Get active channel components
-        active_components = []
-        if self.active_channels["tx"]:
-            active_components.append(".tx")
-        if self.active_channels["ty"]:
-            active_components.append(".ty")
-        if self.active_channels["tz"]:
-            active_components.append(".tz")
-        if self.active_channels["rx"]:
-            active_components.append(".rx")
-        if self.active_channels["ry"]:
-            active_components.append(".ry")
-        if self.active_channels["rz"]:
-            active_components.append(".rz")
+        # Active channel components, kept up to date by update_channel_state
+        active_components = self._active_components
         
         try:
-            # First select all the objects (this ensures we get the right context)
+            # First select all the objects (this ensures we get the right context),
+            # replace=True also clears the previous selection
             cmds.select(objects, replace=True)
             
             # Then filter down to just the channels
-            selected_attrs = []
-            for obj in objects:
-                for component in active_components:
-                    attr = obj + component
-                    if cmds.objExists(attr):
-                        selected_attrs.append(attr)
+            candidates = list(map(''.join, product(objects, active_components)))
+            selected_attrs = _existing_nodes(candidates)
             
             # If we have attributes to select, select them
             if selected_attrs:
@@ -441,7 +562,8 @@ class SelectionSetManager:
     
     def set_parent(self, child_name, parent_name):
         """Set a parent-child relationship between sets"""
-        if child_name not in self.sets:
+        child_rec = self.sets.get(child_name)
+        if child_rec is None:
             cmds.warning(f"Child set '{child_name}' not found.")
             return False
         
@@ -454,94 +576,188 @@ class SelectionSetManager:
             cmds.warning(f"Cannot set '{parent_name}' as parent of '{child_name}' - would create circular reference.")
             return False
         
-        # Set the parent
-        self.set_parents[child_name] = parent_name
+        # Set the parent, dropping cached hierarchies of the old and new ancestors
+        self._invalidate_hierarchy(child_name)
+        if child_rec.parent is not None:
+            self.set_children[child_rec.parent].remove(child_name)
+        child_rec.parent = parent_name or None
+        if parent_name:
+            self.set_children.setdefault(parent_name, []).append(child_name)
+        self._invalidate_hierarchy(child_name)
         return True
     
     def would_create_circular_reference(self, child_name, new_parent_name):
         """Check if setting a parent would create a circular reference"""
         # If the child would become its own ancestor, that's a circular reference
         ancestor = new_parent_name
-        while ancestor:
+        visited = set()
+        while ancestor and ancestor not in visited:
             if ancestor == child_name:
                 return True
-            ancestor = self.set_parents.get(ancestor)
+            # Guard against a parent loop read from a damaged file
+            visited.add(ancestor)
+            rec = self.sets.get(ancestor)
+            ancestor = rec.parent if rec is not None else None
         return False
     
     def update_set_position(self, name, x, y):
         """Update the position of a set"""
-        if name in self.sets:
-            self.set_positions[name] = [x, y]
+        rec = self.sets.get(name)
+        if rec is None:
+            return False
+        # Drags often report the same position again
+        if rec.pos == (x, y):
             return True
-        return False
+        rec.pos = (x, y)
+        _grow_max_pos(self._max_set_pos, rec.pos)
+        return True
     
     def update_set_size(self, name, width, height):
         """Update the size of a set"""
-        if name in self.sets:
-            self.set_sizes[name] = [width, height]
+        rec = self.sets.get(name)
+        if rec is None:
+            return False
+        if rec.size == (width, height):
             return True
-        return False
+        rec.size = (width, height)
+        return True
     
     def update_set_color(self, name, r, g, b):
         """Update the color of a set"""
-        if name in self.sets:
-            self.set_colors[name] = [r, g, b]
+        rec = self.sets.get(name)
+        if rec is None:
+            return False
+        if rec.color == (r, g, b):
             return True
-        return False
+        rec.color = (r, g, b)
+        return True
     
     def update_set_transparency(self, name, transparency):
         """Update the transparency of a set"""
-        if name in self.sets:
-            self.set_transparency[name] = transparency
+        rec = self.sets.get(name)
+        if rec is None:
+            return False
+        if rec.transparency == transparency:
             return True
-        return False
+        rec.transparency = transparency
+        return True
+    
+    def bulk_update_geometry(self, set_geometry, group_geometry):
+        """Store positions and sizes for many sets and groups in one call
+        
+        Both arguments map a name to ((x, y), (width, height)). Unknown
+        names are ignored.
+        """
+        for records, max_pos, geometry in ((self.sets, self._max_set_pos, set_geometry),
+                                           (self.parent_groups, self._max_group_pos, group_geometry)):
+            for name, (pos, size) in geometry.items():
+                rec = records.get(name)
+                if rec is not None:
+                    rec.pos = pos
+                    rec.size = size
+                    _grow_max_pos(max_pos, pos)
     
     def update_channel_state(self, channel, state):
         """Update the state of a channel filter"""
         if channel in self.active_channels:
             self.active_channels[channel] = state
+            bit = _CHANNEL_BITS[channel]
+            mask = (self._channel_mask | bit) if state else (self._channel_mask & ~bit)
+            if mask != self._channel_mask:
+                self._channel_mask = mask
+                self._update_active_components()
             return True
         return False
     
+    def _sync_channel_mask(self):
+        """Rebuild the channel bitmask from active_channels"""
+        self._channel_mask = 0
+        for channel in CHANNELS:
+            if self.active_channels[channel]:
+                self._channel_mask |= _CHANNEL_BITS[channel]
+        self._update_active_components()
+    
+    def _update_active_components(self):
+        """Cache the attribute suffixes of the channels in the bitmask"""
+        self._active_components = tuple("." + channel for channel in CHANNELS
+                                        if self._channel_mask & _CHANNEL_BITS[channel])
+    
     def set_background_image(self, image_path):
         """Set the background image"""
         self.background_image = image_path
         return True
     
+    def _build_export_data(self):
+        """Collect all sets, groups and settings into the export file layout"""
+        export_data = {
+            "sets": {},
+            "positions": {},
+            "colors": {},
+            "sizes": {},
+            "transparency": {},
+            "parents": {},
+            "channels": self.active_channels,
+            "background_image": None,
+            # Add parent group data
+            "parent_groups": {},
+            "group_positions": {},
+            "group_colors": {},
+            "group_sizes": {},
+            "group_transparency": {}
+        }
+        
+        # Split the records back into the per-property tables of the file format
+        for name, rec in self.sets.items():
+            export_data["sets"][name] = rec.objects
+            export_data["positions"][name] = rec.pos
+            export_data["colors"][name] = rec.color
+            export_data["sizes"][name] = rec.size
+            export_data["transparency"][name] = rec.transparency
+            export_data["parents"][name] = rec.parent
+        
+        for name, group in self.parent_groups.items():
+            export_data["parent_groups"][name] = list(group.sets)
+            export_data["group_positions"][name] = group.pos
+            export_data["group_colors"][name] = group.color
+            export_data["group_sizes"][name] = group.size
+            export_data["group_transparency"][name] = group.transparency
+        
+        return export_data
+    
     def export_sets(self, file_path):
         """Export selection sets to a JSON file including all customization"""
         try:
-            export_data = {
-                "sets": self.sets,
-                "positions": self.set_positions,
-                "colors": self.set_colors,
-                "sizes": self.set_sizes,
-                "transparency": self.set_transparency,
-                "parents": self.set_parents,
-                "channels": self.active_channels,
-                "background_image": None,
-                # Add parent group data
-                "parent_groups": self.parent_groups,
-                "group_positions": self.group_positions,
-                "group_colors": self.group_colors,
-                "group_sizes": self.group_sizes,
-                "group_transparency": self.group_transparency
-            }
+            export_data = self._build_export_data()
             
             # Handle background image if it exists
-            if self.background_image and os.path.exists(self.background_image):
-                with open(self.background_image, 'rb') as img_file:
-                    img_data = img_file.read()
-                    img_b64 = base64.b64encode(img_data).decode('utf-8')
-                    # Store image data and format
-                    export_data["background_image"] = {
-                        "data": img_b64,
-                        "format": os.path.splitext(self.background_image)[1][1:].lower(),
-                        "path": self.background_image
-                    }
+            has_image = bool(self.background_image and os.path.exists(self.background_image))
+            if has_image:
+                # Store image format, the data is streamed in below
+                export_data["background_image"] = {
+                    "data": _IMAGE_DATA_PLACEHOLDER,
+                    "format": os.path.splitext(self.background_image)[1][1:].lower(),
+                    "path": self.background_image
+                }
             
-            with open(file_path, 'w') as f:
-                json.dump(export_data, f, indent=4)
+            text = _dumps(export_data)
+            with open(file_path, 'wb') as f:
+                if not has_image:
+                    f.write(text)
+                    return True
+                
+                # Base64 encode the image chunk by chunk straight into the file
+                # rather than holding the raw and encoded copies in memory
+                head, tail = text.split(_dumps(_IMAGE_DATA_PLACEHOLDER), 1)
+                f.write(head)
+                f.write(b'"')
+                with open(self.background_image, 'rb') as img_file:
+                    while True:
+                        chunk = img_file.read(_IMAGE_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(base64.b64encode(chunk))
+                f.write(b'"')
+                f.write(tail)
             return True
         except Exception as e:
             cmds.warning(f"Failed to export sets: {str(e)}")
@@ -550,142 +766,169 @@ class SelectionSetManager:
     def import_sets(self, file_path):
         """Import selection sets from a JSON file including all customization"""
         try:
-            with open(file_path, 'r') as f:
-                imported_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                imported_data = _loads(f.read())
             
             # Check data format
             if not isinstance(imported_data, dict) or "sets" not in imported_data:
                 cmds.warning("Invalid JSON format for sets.")
                 return False
             
-            # Import sets
-            imported_sets = imported_data.get("sets", {})
-            imported_positions = imported_data.get("positions", {})
-            imported_colors = imported_data.get("colors", {})
-            imported_sizes = imported_data.get("sizes", {})
-            imported_transparency = imported_data.get("transparency", {})
-            imported_parents = imported_data.get("parents", {})
-            imported_channels = imported_data.get("channels", {})
-            
-            # Import parent group data
-            imported_parent_groups = imported_data.get("parent_groups", {})
-            imported_group_positions = imported_data.get("group_positions", {})
-            imported_group_colors = imported_data.get("group_colors", {})
-            imported_group_sizes = imported_data.get("group_sizes", {})
-            imported_group_transparency = imported_data.get("group_transparency", {})
+            self._load_import_data(imported_data, file_path)
+            return True
+        except Exception as e:
+            cmds.warning(f"Failed to import sets: {str(e)}")
+            return False
+    
+    def export_sets_binary(self, file_path):
+        """Export selection sets to a binary pickle file
+        
+        Much faster than JSON to write and read for large set libraries.
+        The background image is stored as raw bytes.
+        """
+        try:
+            export_data = self._build_export_data()
             
-            # Update channel states if available
-            if imported_channels:
-                for channel, state in imported_channels.items():
-                    if channel in self.active_channels:
-                        self.active_channels[channel] = state
+            if self.background_image and os.path.exists(self.background_image):
+                with open(self.background_image, 'rb') as img_file:
+                    export_data["background_image"] = {
+                        "data": img_file.read(),
+                        "format": os.path.splitext(self.background_image)[1][1:].lower(),
+                        "path": self.background_image
+                    }
             
-            # Clear existing sets and groups
-            self.sets.clear()
-            self.set_positions.clear()
-            self.set_colors.clear()
-            self.set_sizes.clear()
-            self.set_transparency.clear()
-            self.set_parents.clear()
-            self.parent_groups.clear()
-            self.group_positions.clear()
-            self.group_colors.clear()
-            self.group_sizes.clear()
-            self.group_transparency.clear()
+            with open(file_path, 'wb') as f:
+                pickle.dump(export_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            return True
+        except Exception as e:
+            cmds.warning(f"Failed to export sets: {str(e)}")
+            return False
+    
+    def import_sets_binary(self, file_path):
+        """Import selection sets from a binary pickle file
+        
+        Only plain data is unpickled, files holding any other object are
+        rejected.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                imported_data = _SetFileUnpickler(f).load()
             
-            # Import all sets
-            for name, objects in imported_sets.items():
-                # Filter out objects that don't exist in the scene
-                valid_objects = [obj for obj in objects if cmds.objExists(obj)]
-                if valid_objects:
-                    self.sets[name] = valid_objects
-                    
-                    # Import position if available
-                    if name in imported_positions:
-                        self.set_positions[name] = imported_positions[name]
-                    else:
-                        # Default position
-                        self.set_positions[name] = [20, 20 + (len(self.sets) * 30)]
-                    
-                    # Import color if available
-                    if name in imported_colors:
-                        self.set_colors[name] = imported_colors[name]
-                    else:
-                        self.set_colors[name] = [70, 70, 70]  # Default
-                    
-                    # Import size if available
-                    if name in imported_sizes:
-                        self.set_sizes[name] = imported_sizes[name]
-                    else:
-                        self.set_sizes[name] = [200, 150]  # Default
-                    
-                    # Import transparency if available
-                    if name in imported_transparency:
-                        self.set_transparency[name] = imported_transparency[name]
-                    else:
-                        self.set_transparency[name] = 180  # Default
+            # Check data format
+            if not isinstance(imported_data, dict) or "sets" not in imported_data:
+                cmds.warning("Invalid binary format for sets.")
+                return False
             
-            # Import parent relationships after all sets are created
-            for name, parent in imported_parents.items():
-                if name in self.sets and (parent is None or parent in self.sets):
-                    self.set_parents[name] = parent
+            self._load_import_data(imported_data, file_path)
+            return True
+        except Exception as e:
+            cmds.warning(f"Failed to import sets: {str(e)}")
+            return False
+    
+    def _load_import_data(self, imported_data, file_path):
+        """Replace all sets, groups and settings with data read from file_path"""
+        # Import sets
+        imported_sets = imported_data.get("sets", {})
+        imported_positions = imported_data.get("positions", {})
+        imported_colors = imported_data.get("colors", {})
+        imported_sizes = imported_data.get("sizes", {})
+        imported_transparency = imported_data.get("transparency", {})
+        imported_parents = imported_data.get("parents", {})
+        imported_channels = imported_data.get("channels", {})
+        
+        # Import parent group data
+        imported_parent_groups = imported_data.get("parent_groups", {})
+        imported_group_positions = imported_data.get("group_positions", {})
+        imported_group_colors = imported_data.get("group_colors", {})
+        imported_group_sizes = imported_data.get("group_sizes", {})
+        imported_group_transparency = imported_data.get("group_transparency", {})
+        
+        # Update channel states if available
+        if imported_channels:
+            for channel, state in imported_channels.items():
+                if channel in self.active_channels:
+                    self.active_channels[channel] = state
+            self._sync_channel_mask()
+        
+        # Clear existing sets and groups
+        self.sets.clear()
+        self.parent_groups.clear()
+        self._set_to_group.clear()
+        self._max_set_pos = [0, 0]
+        self._max_group_pos = [0, 0]
+        
+        # Import all sets. Objects are checked against the scene when the
+        # set is first selected rather than here. Names are interned as the
+        # same controls are usually listed in many sets.
+        for name, objects in imported_sets.items():
+            if objects:
+                self.sets[name] = SetRecord(
+                    [sys.intern(obj) for obj in objects],
+                    # Import position if available, else a default position
+                    tuple(imported_positions.get(name, (20, 20 + ((len(self.sets) + 1) * 30)))),
+                    # Import color, size and transparency if available
+                    tuple(imported_colors.get(name, SET_DEFAULT_COLOR)),
+                    tuple(imported_sizes.get(name, SET_DEFAULT_SIZE)),
+                    imported_transparency.get(name, DEFAULT_TRANSPARENCY)
+                )
+                _grow_max_pos(self._max_set_pos, self.sets[name].pos)
+        
+        # Import parent relationships after all sets are created, filling
+        # the child index in the same pass. Records default to no parent.
+        sets = self.sets
+        children = self.set_children = {}
+        for name, parent in imported_parents.items():
+            rec = sets.get(name)
+            if rec is not None and parent is not None and parent in sets:
+                rec.parent = parent
+                children.setdefault(parent, []).append(name)
+        self._hier_cache.clear()
+        self._validated.clear()
+        
+        # Import parent groups
+        for name, group_sets in imported_parent_groups.items():
+            # Filter out sets that don't exist
+            valid_sets = [set_name for set_name in group_sets if set_name in sets]
+            self.parent_groups[name] = GroupRecord(
+                dict.fromkeys(valid_sets),
+                # Import position if available, else a default position
+                tuple(imported_group_positions.get(name, (20, 20 + ((len(self.parent_groups) + 1) * 30)))),
+                # Import color, size and transparency if available
+                tuple(imported_group_colors.get(name, GROUP_DEFAULT_COLOR)),
+                tuple(imported_group_sizes.get(name, GROUP_DEFAULT_SIZE)),
+                imported_group_transparency.get(name, DEFAULT_TRANSPARENCY)
+            )
+            _grow_max_pos(self._max_group_pos, self.parent_groups[name].pos)
             
-            # Import parent groups
-            for name, sets in imported_parent_groups.items():
-                # Filter out sets that don't exist
-                valid_sets = [set_name for set_name in sets if set_name in self.sets]
-                self.parent_groups[name] = valid_sets
-                
-                # Import position if available
-                if name in imported_group_positions:
-                    self.group_positions[name] = imported_group_positions[name]
-                else:
-                    # Default position
-                    self.group_positions[name] = [20, 20 + (len(self.parent_groups) * 30)]
+            # A set belongs to one group, a later group in the file wins
+            for set_name in self.parent_groups[name].sets:
+                old_group_name = self._set_to_group.get(set_name)
+                if old_group_name is not None and old_group_name != name:
+                    del self.parent_groups[old_group_name].sets[set_name]
+                self._set_to_group[set_name] = name
+        
+        # Handle background image if it exists
+        bg_image_data = imported_data.get("background_image", None)
+        if bg_image_data and isinstance(bg_image_data, dict):
+            try:
+                # Save the image to a temp file, binary files hold raw bytes
+                img_data = bg_image_data["data"]
+                if not isinstance(img_data, bytes):
+                    img_data = base64.b64decode(img_data)
+                img_format = bg_image_data.get("format", "png")
                 
-                # Import color if available
-                if name in imported_group_colors:
-                    self.group_colors[name] = imported_group_colors[name]
+                # Try to use the original path first
+                original_path = bg_image_data.get("path")
+                if original_path and os.path.dirname(original_path) and os.access(os.path.dirname(original_path), os.W_OK):
+                    img_path = original_path
                 else:
-                    self.group_colors[name] = [100, 100, 60]  # Default
+                    # Use a temp file in the same directory as the set file
+                    json_dir = os.path.dirname(file_path)
+                    img_path = os.path.join(json_dir, f"selset_bg.{img_format}")
                 
-                # Import size if available
-                if name in imported_group_sizes:
-                    self.group_sizes[name] = imported_group_sizes[name]
-                else:
-                    self.group_sizes[name] = [300, 200]  # Default
+                with open(img_path, 'wb') as img_file:
+                    img_file.write(img_data)
                 
-                # Import transparency if available
-                if name in imported_group_transparency:
-                    self.group_transparency[name] = imported_group_transparency[name]
-                else:
-                    self.group_transparency[name] = 180  # Default
-            
-            # Handle background image if it exists
-            bg_image_data = imported_data.get("background_image", None)
-            if bg_image_data and isinstance(bg_image_data, dict):
-                try:
-                    # Save the image to a temp file
-                    img_data = base64.b64decode(bg_image_data["data"])
-                    img_format = bg_image_data.get("format", "png")
-                    
-                    # Try to use the original path first
-                    original_path = bg_image_data.get("path")
-                    if original_path and os.path.dirname(original_path) and os.access(os.path.dirname(original_path), os.W_OK):
-                        img_path = original_path
-                    else:
-                        # Use a temp file in the same directory as the JSON
-                        json_dir = os.path.dirname(file_path)
-                        img_path = os.path.join(json_dir, f"selset_bg.{img_format}")
-                    
-                    with open(img_path, 'wb') as img_file:
-                        img_file.write(img_data)
-                    
-                    self.background_image = img_path
-                except Exception as e:
-                    cmds.warning(f"Failed to restore background image: {str(e)}")
-            
-            return True
-        except Exception as e:
-            cmds.warning(f"Failed to import sets: {str(e)}")
-            return False
\ No newline at end of file
+                self.background_image = img_path
+            except Exception as e:
+                cmds.warning(f"Failed to restore background image: {str(e)}")
@@ -10,17 +10,24 @@ import maya.cmds as cmds
 from PySide2 import QtCore, QtWidgets, QtGui
 import os
 
-from SelectionSetManager.managers import SelectionSetManager
+from SelectionSetManager.managers import SelectionSetManager, BINARY_SET_EXT
 from SelectionSetManager.widgets.workspace import SelectionSetWorkspace
 from SelectionSetManager.widgets.channel_panel import ChannelSelectionPanel
 from SelectionSetManager.widgets.chain_panel import ChainSelectionPanel
-from SelectionSetManager.utils import maya_main_window
+from SelectionSetManager.utils import maya_main_window, standard_icon, remove_color_callbacks
+
+# File dialog filter for set exports and imports
+SET_FILE_FILTER = f"JSON Files (*.json);;Binary Set Files (*{BINARY_SET_EXT})"
 
 class SelectionSetUI(QtWidgets.QDialog):
     """UI for the Selection Set Manager"""
     
+    # Most recently created instance, used by show_ui to close it again
+    _instance = None
+    
     def __init__(self, parent=maya_main_window()):
         super(SelectionSetUI, self).__init__(parent)
+        SelectionSetUI._instance = self
         
         self.setWindowTitle("Advanced Selection Set Manager")
         self.setMinimumWidth(800)
@@ -29,10 +36,32 @@ class SelectionSetUI(QtWidgets.QDialog):
         
         self.manager = SelectionSetManager()
         
+        # Channel states and the selection left by the last channel filter pass
+        self._last_channel_state = None
+        
         self.create_ui()
         self.create_connections()
         self.apply_stylesheet()
     
+    def showEvent(self, event):
+        """Watch the scene again when a hidden window is shown"""
+        super(SelectionSetUI, self).showEvent(event)
+        self.manager.add_callbacks()
+    
+    def done(self, result):
+        """Remove scene callbacks when the dialog is hidden, Esc skips closeEvent"""
+        self.manager.remove_callbacks()
+        remove_color_callbacks()
+        super(SelectionSetUI, self).done(result)
+    
+    def closeEvent(self, event):
+        """Remove scene callbacks and forget the cached instance when the window closes"""
+        self.manager.remove_callbacks()
+        remove_color_callbacks()
+        if SelectionSetUI._instance is self:
+            SelectionSetUI._instance = None
+        super(SelectionSetUI, self).closeEvent(event)
+    
     def create_ui(self):
         """Create the UI layout and widgets"""
         main_layout = QtWidgets.QVBoxLayout(self)
@@ -58,22 +87,22 @@ class SelectionSetUI(QtWidgets.QDialog):
         
         # Create set button
         self.create_btn = QtWidgets.QPushButton("Create Set")
-        self.create_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_FileDialogNewFolder))
+        self.create_btn.setIcon(standard_icon(QtWidgets.QStyle.SP_FileDialogNewFolder))
         
         # Create parent group button
         self.create_group_btn = QtWidgets.QPushButton("Create Group")
-        self.create_group_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_DirIcon))
+        self.create_group_btn.setIcon(standard_icon(QtWidgets.QStyle.SP_DirIcon))
         
         # Set background image button
         self.bg_image_btn = QtWidgets.QPushButton("Set Background Image")
-        self.bg_image_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_FileDialogInfoView))
+        self.bg_image_btn.setIcon(standard_icon(QtWidgets.QStyle.SP_FileDialogInfoView))
         
         # Export/Import buttons
         self.export_btn = QtWidgets.QPushButton("Export Sets")
-        self.export_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_DialogSaveButton))
+        self.export_btn.setIcon(standard_icon(QtWidgets.QStyle.SP_DialogSaveButton))
         
         self.import_btn = QtWidgets.QPushButton("Import Sets")
-        self.import_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_DialogOpenButton))
+        self.import_btn.setIcon(standard_icon(QtWidgets.QStyle.SP_DialogOpenButton))
         
         # Add buttons to toolbar
         toolbar_layout.addWidget(self.create_btn)
@@ -94,7 +123,10 @@ class SelectionSetUI(QtWidgets.QDialog):
         workspace_frame = QtWidgets.QFrame()
         workspace_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
         workspace_frame.setFrameShadow(QtWidgets.QFrame.Sunken)
-        workspace_frame.setStyleSheet("QFrame { background-color: #333; border: 1px solid #555; }")
+        # Scoped by name, an unscoped QFrame rule here would also restyle every
+        # QLabel and QListView inside the set and group widgets
+        workspace_frame.setObjectName("workspaceFrame")
+        workspace_frame.setStyleSheet("QFrame#workspaceFrame { background-color: #333; border: 1px solid #555; }")
         
         workspace_layout = QtWidgets.QVBoxLayout(workspace_frame)
         workspace_layout.setContentsMargins(1, 1, 1, 1)
@@ -139,12 +171,16 @@ class SelectionSetUI(QtWidgets.QDialog):
         selected = cmds.ls(selection=True)
         
         if selected:
-            # Store the current selection to restore it with new channel settings
-            selected_objects = selected
+            # Nothing to redo if neither the channels nor the selection
+            # changed since the last pass
+            channels = tuple(self.manager.active_channels.values())
+            if (channels, selected) == self._last_channel_state:
+                return
             
-            # Re-select the same objects but with the new channel settings
-            cmds.select(clear=True)
-            self.manager.select_objects_with_channel_filtering(selected_objects)
+            # Re-select the same objects but with the new channel settings,
+            # the filtered select replaces the selection itself
+            self.manager.select_objects_with_channel_filtering(selected)
+            self._last_channel_state = (channels, cmds.ls(selection=True))
     
     def apply_stylesheet(self):
         """Apply custom stylesheet to the UI"""
@@ -195,6 +231,81 @@ class SelectionSetUI(QtWidgets.QDialog):
                 padding: 2px 4px;
                 border-radius: 2px;
             }
+            QFrame#panelSeparator {
+                background-color: #555;
+            }
+            ChannelSelectionPanel QCheckBox {
+                color: #ddd;
+                spacing: 5px;
+            }
+            ChannelSelectionPanel QCheckBox[active="true"] {
+                color: #0af;
+            }
+            ChannelSelectionPanel QCheckBox::indicator {
+                width: 16px;
+                height: 16px;
+            }
+            ChannelSelectionPanel QCheckBox::indicator:unchecked {
+                border: 1px solid #777;
+                background-color: #555;
+            }
+            ChannelSelectionPanel QCheckBox::indicator:checked {
+                border: 1px solid #0af;
+                background-color: #0af;
+            }
+            ResizeHandle {
+                background-color: #777;
+                border-radius: 2px;
+            }
+            ResizeHandle:hover {
+                background-color: #999;
+            }
+            DraggableSetWidget QWidget#setHeader {
+                background-color: #3a3a3a;
+                border-top-left-radius: 4px;
+                border-top-right-radius: 4px;
+            }
+            DraggableSetWidget QToolButton#setExpand,
+            DraggableSetWidget QToolButton#setClose {
+                background-color: transparent;
+            }
+            DraggableSetWidget QLabel#setTitle {
+                font-weight: bold;
+                color: #ddd;
+            }
+            DraggableSetWidget QListView#setObjects {
+                background-color: rgba(50, 50, 50, 120);
+                border-radius: 3px;
+                border: 1px solid #555;
+                padding: 2px;
+            }
+            DraggableSetWidget QListView#setObjects::item {
+                padding: 2px;
+            }
+            DraggableSetWidget QListView#setObjects::item:hover {
+                background-color: rgba(100, 100, 100, 120);
+            }
+            DraggableSetWidget QListView#setObjects::item:selected {
+                background-color: rgba(0, 160, 230, 120);
+            }
+            DraggableSetWidget QListView#setObjects::item:alternate {
+                background-color: rgba(60, 60, 60, 120);
+            }
+            ParentGroupWidget QWidget#groupHeader {
+                background-color: #5a5a3a;
+                border-top-left-radius: 4px;
+                border-top-right-radius: 4px;
+            }
+            ParentGroupWidget QToolButton#groupExpand,
+            ParentGroupWidget QToolButton#groupClose {
+                background-color: transparent;
+            }
+            ParentGroupWidget QLabel#groupTitle {
+                font-weight: bold;
+                color: #ff9;
+                background-color: transparent;
+                border: none;
+            }
         """)
     
     def create_set(self):
@@ -216,112 +327,81 @@ class SelectionSetUI(QtWidgets.QDialog):
             self.workspace.set_background_image(file_path)
     
     def export_sets(self):
-        """Export sets to a JSON file"""
+        """Export sets to a JSON or binary set file"""
         if not self.manager.sets and not self.manager.parent_groups:
             cmds.warning("No sets or groups to export.")
             return
         
-        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Export Selection Sets", "", "JSON Files (*.json)"
+        file_path, selected_filter = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export Selection Sets", "", SET_FILE_FILTER
         )
         
         if file_path:
-            if not file_path.endswith(".json"):
+            binary = file_path.endswith(BINARY_SET_EXT) or (
+                not file_path.endswith(".json") and selected_filter.endswith(f"(*{BINARY_SET_EXT})")
+            )
+            if binary and not file_path.endswith(BINARY_SET_EXT):
+                file_path += BINARY_SET_EXT
+            elif not binary and not file_path.endswith(".json"):
                 file_path += ".json"
             
-            # Update positions and sizes from workspace before exporting
-            for set_name, widget in self.workspace.set_widgets.items():
-                self.manager.update_set_position(
-                    set_name, widget.pos().x(), widget.pos().y()
-                )
-                self.manager.update_set_size(
-                    set_name, widget.width(), widget.height()
-                )
-            
-            # Update parent group positions and sizes
-            for group_name, widget in self.workspace.group_widgets.items():
-                self.manager.update_group_position(
-                    group_name, widget.pos().x(), widget.pos().y()
-                )
-                self.manager.update_group_size(
-                    group_name, widget.width(), widget.height()
-                )
+            # Update set and parent group positions and sizes from workspace before exporting
+            self.manager.bulk_update_geometry(
+                {name: ((w.x(), w.y()), (w.width(), w.height()))
+                 for name, w in self.workspace.set_widgets.items()},
+                {name: ((w.x(), w.y()), (w.width(), w.height()))
+                 for name, w in self.workspace.group_widgets.items()}
+            )
             
-            if self.manager.export_sets(file_path):
+            export = self.manager.export_sets_binary if binary else self.manager.export_sets
+            if export(file_path):
                 cmds.inViewMessage(
                     amg=f"Successfully exported sets to {os.path.basename(file_path)}",
                     pos='midCenter', fade=True
                 )
     
     def import_sets(self):
-        """Import sets from a JSON file"""
+        """Import sets from a JSON or binary set file"""
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Import Selection Sets", "", "JSON Files (*.json)"
+            self, "Import Selection Sets", "", SET_FILE_FILTER
         )
         
         if file_path:
-            if self.manager.import_sets(file_path):
-                # Clear existing widgets
-                for widget in list(self.workspace.set_widgets.values()):
-                    widget.setParent(None)
-                    widget.deleteLater()
-                self.workspace.set_widgets.clear()
-                
-                for widget in list(self.workspace.group_widgets.values()):
-                    widget.setParent(None)
-                    widget.deleteLater()
-                self.workspace.group_widgets.clear()
+            if file_path.endswith(BINARY_SET_EXT):
+                imported = self.manager.import_sets_binary(file_path)
+            else:
+                imported = self.manager.import_sets(file_path)
+            if imported:
+                # Rebuild with painting held off so the workspace repaints once
+                with self.workspace.bulk():
+                    # Clear existing widgets
+                    for widget in list(self.workspace.set_widgets.values()):
+                        widget.setParent(None)
+                        widget.deleteLater()
+                    self.workspace.set_widgets.clear()
                 
-                # Add parent group widgets
-                for group_name in self.manager.parent_groups:
-                    # Get position
-                    pos_x, pos_y = None, None
-                    if group_name in self.manager.group_positions:
-                        pos_x, pos_y = self.manager.group_positions[group_name]
-                    
-                    # Get size
-                    width, height = None, None
-                    if group_name in self.manager.group_sizes:
-                        width, height = self.manager.group_sizes[group_name]
-                    
-                    # Add the widget
-                    self.workspace.add_parent_group_widget(group_name, pos_x, pos_y, width, height)
+                    for widget in list(self.workspace.group_widgets.values()):
+                        widget.setParent(None)
+                        widget.deleteLater()
+                    self.workspace.group_widgets.clear()
                 
-                # Add new set widgets with all properties
-                for set_name in self.manager.sets:
-                    # Get position
-                    pos_x, pos_y = None, None
-                    if set_name in self.manager.set_positions:
-                        pos_x, pos_y = self.manager.set_positions[set_name]
-                    
-                    # Get size
-                    width, height = None, None
-                    if set_name in self.manager.set_sizes:
-                        width, height = self.manager.set_sizes[set_name]
-                    
-                    # Add the widget
-                    self.workspace.add_set_widget(set_name, pos_x, pos_y, width, height)
-                    
-                    # Set properties
-                    if set_name in self.manager.set_colors:
-                        r, g, b = self.manager.set_colors[set_name]
-                        self.workspace.update_widget_color(set_name, r, g, b)
-                    
-                    if set_name in self.manager.set_transparency:
-                        transp = self.manager.set_transparency[set_name]
-                        self.workspace.update_widget_transparency(set_name, transp)
+                    # Add parent group widgets, position, size, color and
+                    # transparency are read from the group records
+                    for group_name in self.manager.parent_groups:
+                        self.workspace.add_parent_group_widget(group_name)
                 
-                # Add sets to groups
-                for group_name, set_names in self.manager.parent_groups.items():
-                    for set_name in set_names:
-                        self.workspace.add_set_to_group(set_name, group_name)
+                    # Add new set widgets with all properties from the set records
+                    for set_name in self.manager.sets:
+                        self.workspace.add_set_widget(set_name)
                 
-                # Set background image if one was imported
-                if self.manager.background_image:
-                    self.workspace.set_background_image(self.manager.background_image)
+                    # Add sets to groups
+                    for group_name, group_rec in self.manager.parent_groups.items():
+                        for set_name in list(group_rec.sets):
+                            self.workspace.add_set_to_group(set_name, group_name)
                 
-                # Update parent-child relationships
-                self.workspace.update_widget_parent_indicators()
+                    # Set background image if one was imported
+                    if self.manager.background_image:
+                        self.workspace.set_background_image(self.manager.background_image)
                 
                 cmds.inViewMessage(
                     amg=f"Successfully imported sets from {os.path.basename(file_path)}",
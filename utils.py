@@ -7,9 +7,51 @@ This file contains various utility functions used throughout the application.
 
 import maya.cmds as cmds
 import maya.OpenMayaUI as omui
-from PySide2 import QtWidgets
+import maya.api.OpenMaya as om
+from PySide2 import QtWidgets, QtGui
 from shiboken2 import wrapInstance
 
+# Standard style icons by QStyle.StandardPixmap, see standard_icon
+_ICON_CACHE = {}
+
+# Standard icon shown for each common Maya object type
+_TYPE_ICONS = {
+    'transform': QtWidgets.QStyle.SP_TitleBarNormalButton,
+    'mesh': QtWidgets.QStyle.SP_FileIcon,
+    'joint': QtWidgets.QStyle.SP_TitleBarContextHelpButton,
+    'camera': QtWidgets.QStyle.SP_ComputerIcon,
+    'light': QtWidgets.QStyle.SP_MessageBoxInformation,
+    'nurbsCurve': QtWidgets.QStyle.SP_FileLinkIcon,
+    'nurbsSurface': QtWidgets.QStyle.SP_FileDialogDetailedView
+}
+
+# Icons by object type and the default under '', filled on first use
+_TYPE_ICON_CACHE = {}
+
+# RGB of the override color indices, simplified - a full implementation
+# would need Maya's complete color table
+_OVERRIDE_COLORS = (
+    (0.6, 0.6, 0.6),  # Gray
+    (0.0, 0.0, 0.0),  # Black
+    (0.25, 0.25, 0.25),  # Dark Gray
+    (0.6, 0.6, 0.6),  # Light Gray
+    (0.8, 0.0, 0.0),  # Dark Red
+    (0.0, 0.0, 0.8),  # Dark Blue
+    (0.0, 0.8, 0.0),  # Dark Green
+    (0.0, 0.8, 0.8),  # Dark Cyan
+    (0.8, 0.0, 0.8),  # Dark Magenta
+    (0.8, 0.8, 0.0),  # Dark Yellow
+    # Add more colors as needed
+)
+_OVERRIDE_DEFAULT_COLOR = (0.6, 0.6, 0.6)
+
+# Override color per object name, see get_object_color. Scene callbacks
+# clear it, a per-node callback drops an entry when its override changes.
+_color_cache = {}
+_NOT_CACHED = object()
+_color_scene_callback_ids = []
+_color_node_callback_ids = {}
+
 def maya_main_window():
     """
     Return the Maya main window widget as a Python object
@@ -26,17 +68,24 @@ def get_unique_name(base_name, existing_names):
     
     Args:
         base_name (str): The base name to start with
-        existing_names (list): List of existing names to avoid duplicates
+        existing_names (iterable): Existing names to avoid duplicates, a set
+            or dict is used as is, anything else is copied into a set once
         
     Returns:
         str: A unique name that doesn't exist in the existing_names list
     """
-    name = base_name
-    counter = 1
+    if not isinstance(existing_names, (set, frozenset, dict)):
+        existing_names = set(existing_names)
     
+    if base_name not in existing_names:
+        return base_name
+    
+    # The lowest free suffix wins, each probe is a single hash lookup
+    counter = 1
+    name = f"{base_name}_{counter}"
     while name in existing_names:
-        name = f"{base_name}_{counter}"
         counter += 1
+        name = f"{base_name}_{counter}"
     
     return name
 
@@ -50,7 +99,23 @@ def short_name(full_path):
     Returns:
         str: The short name ('pSphere1')
     """
-    return full_path.split('|')[-1]
+    return full_path.rpartition('|')[2]
+
+def standard_icon(which):
+    """
+    Get a standard style icon, creating it only once per process
+    
+    Args:
+        which (QStyle.StandardPixmap): Standard icon to get, e.g. QStyle.SP_DirIcon
+        
+    Returns:
+        QIcon: The cached icon from the application style
+    """
+    icon = _ICON_CACHE.get(which)
+    if icon is None:
+        icon = QtWidgets.QApplication.style().standardIcon(which)
+        _ICON_CACHE[which] = icon
+    return icon
 
 def get_object_type_icon(obj_type):
     """
@@ -62,65 +127,101 @@ def get_object_type_icon(obj_type):
     Returns:
         QIcon: Icon representing the object type
     """
-    from PySide2 import QtGui
-    
-    # Define icons for common types
-    icon_map = {
-        'transform': QtWidgets.QStyle.SP_TitleBarNormalButton,
-        'mesh': QtWidgets.QStyle.SP_FileIcon,
-        'joint': QtWidgets.QStyle.SP_TitleBarContextHelpButton,
-        'camera': QtWidgets.QStyle.SP_ComputerIcon,
-        'light': QtWidgets.QStyle.SP_MessageBoxInformation,
-        'nurbsCurve': QtWidgets.QStyle.SP_FileLinkIcon,
-        'nurbsSurface': QtWidgets.QStyle.SP_FileDialogDetailedView
-    }
-    
-    # Get icon based on object type
-    style = QtWidgets.QApplication.style()
-    if obj_type in icon_map:
-        return style.standardIcon(icon_map[obj_type])
-    else:
-        # Default icon for unknown types
-        return style.standardIcon(QtWidgets.QStyle.SP_FileIcon)
+    if not _TYPE_ICON_CACHE:
+        # Style icons need the application, do not cache a placeholder
+        if QtWidgets.QApplication.instance() is None:
+            return QtGui.QIcon()
+        
+        # Resolve every type icon and the default once
+        for type_name, which in _TYPE_ICONS.items():
+            _TYPE_ICON_CACHE[type_name] = standard_icon(which)
+        _TYPE_ICON_CACHE[''] = standard_icon(QtWidgets.QStyle.SP_FileIcon)
+    
+    # Get icon based on object type, default icon for unknown types
+    return _TYPE_ICON_CACHE.get(obj_type, _TYPE_ICON_CACHE[''])
 
 def get_object_color(obj_name):
     """
     Get the display color of a Maya object if it has an override
     
+    The result is cached per name until the override attributes of the
+    object change or the scene changes.
+    
     Args:
         obj_name (str): Name of the Maya object
         
     Returns:
         tuple: (r, g, b) tuple of color values, or None if no override
     """
+    color = _color_cache.get(obj_name, _NOT_CACHED)
+    if color is not _NOT_CACHED:
+        return color
+    
     if not cmds.objExists(obj_name):
         return None
     
-    # Check if object has color override
+    color = None
+    
+    # Check if object has color override, only DAG nodes have the attributes
     try:
-        if cmds.getAttr(f"{obj_name}.overrideEnabled"):
+        if (cmds.attributeQuery('overrideEnabled', node=obj_name, exists=True)
+                and cmds.getAttr(f"{obj_name}.overrideEnabled")):
             color_index = cmds.getAttr(f"{obj_name}.overrideColor")
-            # Convert color index to RGB using Maya's color table
-            # This is simplified - a full implementation would need the complete color map
-            color_map = {
-                0: (0.6, 0.6, 0.6),  # Gray
-                1: (0.0, 0.0, 0.0),  # Black
-                2: (0.25, 0.25, 0.25),  # Dark Gray
-                3: (0.6, 0.6, 0.6),  # Light Gray
-                4: (0.8, 0.0, 0.0),  # Dark Red
-                5: (0.0, 0.0, 0.8),  # Dark Blue
-                6: (0.0, 0.8, 0.0),  # Dark Green
-                7: (0.0, 0.8, 0.8),  # Dark Cyan
-                8: (0.8, 0.0, 0.8),  # Dark Magenta
-                9: (0.8, 0.8, 0.0),  # Dark Yellow
-                # Add more colors as needed
-            }
-            
-            return color_map.get(color_index, (0.6, 0.6, 0.6))  # Default to gray if not found
-    except:
-        pass
-    
-    return None
+            # Convert color index to RGB, default to gray if not found
+            if 0 <= color_index < len(_OVERRIDE_COLORS):
+                color = _OVERRIDE_COLORS[color_index]
+            else:
+                color = _OVERRIDE_DEFAULT_COLOR
+    except RuntimeError:
+        # Ambiguous or otherwise unreadable names are not cached
+        return None
+    
+    if _watch_object_color(obj_name):
+        _color_cache[obj_name] = color
+    return color
+
+def _watch_object_color(obj_name):
+    """Register the callbacks that keep the cached color of obj_name valid"""
+    if not _color_scene_callback_ids:
+        # Names can point at other nodes after any of these
+        _color_scene_callback_ids.extend([
+            om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeNew, _clear_color_cache),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeOpen, _clear_color_cache),
+            om.MDGMessage.addNodeRemovedCallback(_clear_color_cache, "dependNode"),
+            om.MEventMessage.addEventCallback("NameChanged", _clear_color_cache),
+        ])
+    
+    try:
+        sel = om.MSelectionList()
+        sel.add(obj_name)
+        node = sel.getDependNode(0)
+    except RuntimeError:
+        return False
+    
+    if obj_name not in _color_node_callback_ids:
+        _color_node_callback_ids[obj_name] = om.MNodeMessage.addAttributeChangedCallback(
+            node, _on_override_changed, obj_name
+        )
+    return True
+
+def _on_override_changed(msg, plug, other_plug, obj_name):
+    """Node callback, forget the cached color when an override attribute changes"""
+    if plug.partialName(useLongNames=True) in ('overrideEnabled', 'overrideColor'):
+        _color_cache.pop(obj_name, None)
+
+def _clear_color_cache(*args):
+    """Scene callback, forget every cached color and its node callbacks"""
+    _color_cache.clear()
+    if _color_node_callback_ids:
+        om.MMessage.removeCallbacks(list(_color_node_callback_ids.values()))
+        _color_node_callback_ids.clear()
+
+def remove_color_callbacks():
+    """Remove the callbacks registered by get_object_color, call on shutdown"""
+    _clear_color_cache()
+    if _color_scene_callback_ids:
+        om.MMessage.removeCallbacks(_color_scene_callback_ids)
+        del _color_scene_callback_ids[:]
 
 def create_directory_if_not_exists(directory_path):
     """
@@ -135,8 +236,7 @@ def create_directory_if_not_exists(directory_path):
     import os
     
     try:
-        if not os.path.exists(directory_path):
-            os.makedirs(directory_path)
+        os.makedirs(directory_path, exist_ok=True)
         return True
     except Exception as e:
         cmds.warning(f"Failed to create directory: {directory_path}. Error: {str(e)}")
@@ -7,6 +7,68 @@ This file contains reusable widget components used throughout the application.
 
 import maya.cmds as cmds
 from PySide2 import QtCore, QtWidgets, QtGui
+from functools import partial
+
+# Predefined colors for the color menu: (name, (r, g, b))
+_PALETTE = (
+    ("Red", (180, 60, 60)),
+    ("Green", (60, 180, 60)),
+    ("Blue", (60, 60, 180)),
+    ("Yellow", (180, 180, 60)),
+    ("Cyan", (60, 180, 180)),
+    ("Magenta", (180, 60, 180)),
+    ("Gray", (120, 120, 120)),
+    ("Dark Gray", (70, 70, 70)),
+    ("Light Gray", (180, 180, 180))
+)
+
+# Transparency options for the transparency menu (0-255)
+_TRANSPARENCIES = (255, 200, 150, 100, 50)
+
+# Initial color shown by show_color_picker when none is given
+_DEFAULT_PICKER_COLOR = QtGui.QColor(70, 70, 70)
+
+# Cache of color swatch icons: {(r, g, b): (QIcon, ColorSwatchEngine)}
+# The engine is kept alongside its icon so Python never collects it first
+_COLOR_ICON_CACHE = {}
+
+
+class ColorSwatchEngine(QtGui.QIconEngine):
+    """Icon engine that paints a solid color swatch at whatever size is requested"""
+    
+    def __init__(self, color):
+        super(ColorSwatchEngine, self).__init__()
+        self._color = QtGui.QColor(color)
+    
+    def paint(self, painter, rect, mode, state):
+        painter.fillRect(rect, self._color)
+    
+    def pixmap(self, size, mode, state):
+        pixmap = QtGui.QPixmap(size)
+        pixmap.fill(self._color)
+        return pixmap
+    
+    def clone(self):
+        return ColorSwatchEngine(self._color)
+
+
+def _color_icon(rgb):
+    """
+    Return a cached swatch icon for the given color
+    
+    Args:
+        rgb (tuple): (r, g, b) tuple of color values
+    
+    Returns:
+        QIcon: Icon filled with the given color
+    """
+    cached = _COLOR_ICON_CACHE.get(rgb)
+    if cached is None:
+        engine = ColorSwatchEngine(QtGui.QColor(*rgb))
+        cached = (QtGui.QIcon(engine), engine)
+        _COLOR_ICON_CACHE[rgb] = cached
+    return cached[0]
+
 
 class ResizeHandle(QtWidgets.QWidget):
     """Resize handle for widgets"""
@@ -16,17 +78,6 @@ class ResizeHandle(QtWidgets.QWidget):
         self.setFixedSize(10, 10)
         self.setCursor(QtCore.Qt.SizeFDiagCursor)
         
-        # Set style
-        self.setStyleSheet("""
-            ResizeHandle {
-                background-color: #777;
-                border-radius: 2px;
-            }
-            ResizeHandle:hover {
-                background-color: #999;
-            }
-        """)
-        
         self.dragging = False
         self.drag_start_pos = None
         self.parent_start_size = None
@@ -76,40 +127,33 @@ def get_color_menu(title, parent_widget, set_color_callback):
     """
     color_menu = QtWidgets.QMenu(title, parent_widget)
     
-    # Predefined colors
-    colors = [
-        ("Red", QtGui.QColor(180, 60, 60)),
-        ("Green", QtGui.QColor(60, 180, 60)),
-        ("Blue", QtGui.QColor(60, 60, 180)),
-        ("Yellow", QtGui.QColor(180, 180, 60)),
-        ("Cyan", QtGui.QColor(60, 180, 180)),
-        ("Magenta", QtGui.QColor(180, 60, 180)),
-        ("Gray", QtGui.QColor(120, 120, 120)),
-        ("Dark Gray", QtGui.QColor(70, 70, 70)),
-        ("Light Gray", QtGui.QColor(180, 180, 180))
-    ]
-    
-    for name, color in colors:
+    for name, rgb in _PALETTE:
         action = color_menu.addAction(name)
-        # Create color icon
-        pixmap = QtGui.QPixmap(16, 16)
-        pixmap.fill(color)
-        action.setIcon(QtGui.QIcon(pixmap))
-        action.triggered.connect(
-            lambda checked=False, r=color.red(), g=color.green(), b=color.blue(): 
-            set_color_callback(r, g, b)
-        )
-    
-    # Add custom color picker option
+        # Reuse the cached color icon
+        action.setIcon(_color_icon(rgb))
+        action.setData(rgb)
+    
+    # Add custom color picker option (no data, opens the picker)
     color_menu.addSeparator()
-    custom_action = color_menu.addAction("Custom...")
-    custom_action.triggered.connect(
-        lambda: show_color_picker(parent_widget, set_color_callback)
+    color_menu.addAction("Custom...")
+    
+    # One shared slot for every action, the color travels on the action data
+    color_menu.triggered.connect(
+        partial(_on_color_action, parent_widget, set_color_callback)
     )
     
     return color_menu
 
 
+def _on_color_action(parent_widget, set_color_callback, action):
+    """Handle a color menu action, falling back to the picker for "Custom..." """
+    rgb = action.data()
+    if rgb is None:
+        show_color_picker(parent_widget, set_color_callback)
+    else:
+        set_color_callback(*rgb)
+
+
 def get_transparency_menu(title, parent_widget, set_transparency_callback):
     """
     Create a transparency selection submenu
@@ -126,12 +170,15 @@ def get_transparency_menu(title, parent_widget, set_transparency_callback):
     transp_menu = QtWidgets.QMenu(title, parent_widget)
     
     # Transparency options
-    for transp in [255, 200, 150, 100, 50]:
+    for transp in _TRANSPARENCIES:
         percentage = int((transp/255.0)*100)
         action = transp_menu.addAction(f"{percentage}%")
-        action.triggered.connect(
-            lambda checked=False, t=transp: set_transparency_callback(t)
-        )
+        action.setData(transp)
+    
+    # One shared slot for every action, the value travels on the action data
+    transp_menu.triggered.connect(
+        lambda action: set_transparency_callback(action.data())
+    )
     
     return transp_menu
 
@@ -146,7 +193,7 @@ def show_color_picker(parent_widget, set_color_callback, initial_color=None):
         initial_color (QColor, optional): Initial color to show in the dialog
     """
     if initial_color is None:
-        initial_color = QtGui.QColor(70, 70, 70)
+        initial_color = _DEFAULT_PICKER_COLOR
     
     color = QtWidgets.QColorDialog.getColor(
         initial_color, parent_widget, "Choose Color"
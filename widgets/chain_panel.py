@@ -25,7 +25,6 @@ class ChainSelectionPanel(QtWidgets.QWidget):
         
         # Create "Chain Selection:" label
         label = QtWidgets.QLabel("Chain Selection:")
-        label.setStyleSheet("color: #ddd;")
         layout.addWidget(label)
         
         # Create buttons for chain operations
@@ -43,11 +42,10 @@ class ChainSelectionPanel(QtWidgets.QWidget):
         separator = QtWidgets.QFrame()
         separator.setFrameShape(QtWidgets.QFrame.VLine)
         separator.setFrameShadow(QtWidgets.QFrame.Sunken)
-        separator.setStyleSheet("background-color: #555;")
+        separator.setObjectName("panelSeparator")
         
         # Create text field and label for chain name
         name_label = QtWidgets.QLabel("Set Name:")
-        name_label.setStyleSheet("color: #ddd;")
         
         self.chain_name_field = QtWidgets.QLineEdit()
         self.chain_name_field.setPlaceholderText("Auto")
@@ -33,32 +33,11 @@ class ChannelSelectionPanel(QtWidgets.QWidget):
         self.ry_check = QtWidgets.QCheckBox("RY")
         self.rz_check = QtWidgets.QCheckBox("RZ")
         
-        # Style the checkboxes
-        checkbox_style = """
-            QCheckBox {
-                color: #ddd;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 1px solid #777;
-                background-color: #555;
-            }
-            QCheckBox::indicator:checked {
-                border: 1px solid #0af;
-                background-color: #0af;
-            }
-        """
-        
-        self.tx_check.setStyleSheet(checkbox_style)
-        self.ty_check.setStyleSheet(checkbox_style)
-        self.tz_check.setStyleSheet(checkbox_style)
-        self.rx_check.setStyleSheet(checkbox_style)
-        self.ry_check.setStyleSheet(checkbox_style)
-        self.rz_check.setStyleSheet(checkbox_style)
+        # Checkbox/channel pairs shared by the bulk toggle helpers
+        self._checks = (
+            (self.tx_check, "tx"), (self.ty_check, "ty"), (self.tz_check, "tz"),
+            (self.rx_check, "rx"), (self.ry_check, "ry"), (self.rz_check, "rz")
+        )
         
         # Set initial state from manager
         self.tx_check.setChecked(self.manager.active_channels["tx"])
@@ -85,7 +64,7 @@ class ChannelSelectionPanel(QtWidgets.QWidget):
         separator = QtWidgets.QFrame()
         separator.setFrameShape(QtWidgets.QFrame.VLine)
         separator.setFrameShadow(QtWidgets.QFrame.Sunken)
-        separator.setStyleSheet("background-color: #555;")
+        separator.setObjectName("panelSeparator")
         
         # Add select all/none buttons
         select_all_btn = QtWidgets.QPushButton("All")
@@ -117,20 +96,14 @@ class ChannelSelectionPanel(QtWidgets.QWidget):
     
     def updateChannelIndicators(self):
         """Update visual indicators for active channels"""
-        # Change checkbox texts to indicate state
-        tx_color = "#0af" if self.manager.active_channels["tx"] else "#ddd"
-        ty_color = "#0af" if self.manager.active_channels["ty"] else "#ddd"
-        tz_color = "#0af" if self.manager.active_channels["tz"] else "#ddd"
-        rx_color = "#0af" if self.manager.active_channels["rx"] else "#ddd"
-        ry_color = "#0af" if self.manager.active_channels["ry"] else "#ddd"
-        rz_color = "#0af" if self.manager.active_channels["rz"] else "#ddd"
-        
-        self.tx_check.setStyleSheet(f"color: {tx_color}; {self.tx_check.styleSheet()}")
-        self.ty_check.setStyleSheet(f"color: {ty_color}; {self.ty_check.styleSheet()}")
-        self.tz_check.setStyleSheet(f"color: {tz_color}; {self.tz_check.styleSheet()}")
-        self.rx_check.setStyleSheet(f"color: {rx_color}; {self.rx_check.styleSheet()}")
-        self.ry_check.setStyleSheet(f"color: {ry_color}; {self.ry_check.styleSheet()}")
-        self.rz_check.setStyleSheet(f"color: {rz_color}; {self.rz_check.styleSheet()}")
+        for check, channel in self._checks:
+            active = bool(self.manager.active_channels[channel])
+            if check.property("active") == active:
+                continue
+            # Re-polish so the [active="true"] rule is picked up
+            check.setProperty("active", active)
+            check.style().unpolish(check)
+            check.style().polish(check)
     
     def update_channel(self, channel, state):
         """Update the state of a channel in the manager"""
@@ -138,20 +111,22 @@ class ChannelSelectionPanel(QtWidgets.QWidget):
         self.updateChannelIndicators()  # Update visual indicators
         self.channelsChanged.emit()
     
+    def set_all_channels(self, state):
+        """Set every channel without emitting a signal per checkbox"""
+        for check, channel in self._checks:
+            check.blockSignals(True)
+            check.setChecked(state)
+            check.blockSignals(False)
+            self.manager.update_channel_state(channel, state)
+        
+        # Refresh indicators and notify listeners only once
+        self.updateChannelIndicators()
+        self.channelsChanged.emit()
+    
     def select_all_channels(self):
         """Select all channels"""
-        self.tx_check.setChecked(True)
-        self.ty_check.setChecked(True)
-        self.tz_check.setChecked(True)
-        self.rx_check.setChecked(True)
-        self.ry_check.setChecked(True)
-        self.rz_check.setChecked(True)
+        self.set_all_channels(True)
     
     def select_no_channels(self):
         """Deselect all channels"""
-        self.tx_check.setChecked(False)
-        self.ty_check.setChecked(False)
-        self.tz_check.setChecked(False)
-        self.rx_check.setChecked(False)
-        self.ry_check.setChecked(False)
-        self.rz_check.setChecked(False)
\ No newline at end of file
+        self.set_all_channels(False)
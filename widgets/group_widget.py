@@ -8,28 +8,66 @@ of parent groups that can contain sets.
 
 import maya.cmds as cmds
 from PySide2 import QtCore, QtWidgets, QtGui
-from functools import partial
+from functools import partial, lru_cache
 
 from SelectionSetManager.widgets.base_widgets import ResizeHandle, get_color_menu, get_transparency_menu, show_color_picker
+from SelectionSetManager.utils import standard_icon
+
+# Group widget stylesheet, filled in with (r, g, b, a)
+_STYLE_FMT = """
+    ParentGroupWidget {
+        background-color: rgba(%d, %d, %d, %d);
+        border-radius: 5px;
+        border: 1px solid #aa7;
+    }
+    ParentGroupWidget[dropHover="true"] {
+        border: 2px solid #ff0;
+    }
+"""
+
+
+@lru_cache(maxsize=64)
+def _style_for(r, g, b, a):
+    """Return the group stylesheet for a color, memoized across all group widgets"""
+    return _STYLE_FMT % (r, g, b, a)
+
 
 class ParentGroupWidget(QtWidgets.QWidget):
     """Custom widget for parent groups that contain sets but are not sets themselves"""
     
+    # Size policy shared by all group widgets
+    _SIZE_POLICY = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+    
+    # Pixels the cursor must travel before a header press counts as a drag
+    MOVE_THRESHOLD = 3
+    
     def __init__(self, group_name, parent=None):
         super(ParentGroupWidget, self).__init__(parent)
         self.group_name = group_name
         self.expanded = False
         self.drag_position = None
         self.click_without_drag = False
+        self._moved = False  # Set once a drag leaves the click threshold
+        self._press_pos = None
         self.child_widgets = {}  # To track child set widgets: {set_name: widget_reference}
+        self._context_menu = None  # Built on first right-click, then reused
+        
+        # Callbacks registered by the workspace, called with the group name first
+        self.on_position_changed = None  # (group_name, x, y)
+        self.on_size_changed = None  # (group_name, width, height)
+        self.on_delete_requested = None  # (group_name)
+        self.accepts_set = None  # (set_name) -> bool, can the set be dropped here
+        self.on_set_dropped = None  # (set_name, group_name)
+        self._child_extents = {}  # Cached child sizes: {set_name: (height, width)}
+        self._children_height_total = 0  # Sum of cached child heights
+        self._children_max_width = 0  # Largest cached child width
         
         # Set minimum size
         self.setMinimumSize(150, 40)
-        self.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        self.setSizePolicy(ParentGroupWidget._SIZE_POLICY)
         
-        # Enable positioning
+        # Enable positioning, the stylesheet paints the background
         self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
-        self.setAutoFillBackground(True)
         
         # Enable drop for drag-drop operations
         self.setAcceptDrops(True)
@@ -38,6 +76,19 @@ class ParentGroupWidget(QtWidgets.QWidget):
         self.bg_color = [100, 100, 60]  # Yellowish
         self.bg_transparency = 180
         
+        # Coalesce drag moves so only the latest position is applied per tick
+        self._pending_pos = None
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)
+        
+        # Coalesce resize events into a single resize handle move
+        self._relayout_timer = QtCore.QTimer(self)
+        self._relayout_timer.setSingleShot(True)
+        self._relayout_timer.setInterval(0)
+        self._relayout_timer.timeout.connect(self._reposition_handle)
+        
         self.createUI()
     
     def createUI(self):
@@ -48,30 +99,24 @@ class ParentGroupWidget(QtWidgets.QWidget):
         
         # Header layout with title bar styling
         self.header_widget = QtWidgets.QWidget()
-        self.header_widget.setStyleSheet("""
-            QWidget {
-                background-color: #5a5a3a;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-        """)
+        self.header_widget.setObjectName("groupHeader")
         header_layout = QtWidgets.QHBoxLayout(self.header_widget)
         header_layout.setContentsMargins(8, 2, 8, 2)
         
         # Expand/collapse button
         self.expand_btn = QtWidgets.QToolButton()
         self.expand_btn.setArrowType(QtCore.Qt.RightArrow)
-        self.expand_btn.setStyleSheet("QToolButton { background-color: transparent; }")
+        self.expand_btn.setObjectName("groupExpand")
         self.expand_btn.setFixedSize(16, 16)
         
         # Group name label with special styling to distinguish from sets
         self.label = QtWidgets.QLabel(f"Group: {self.group_name}")
-        self.label.setStyleSheet("QLabel { font-weight: bold; color: #ff9; }")
+        self.label.setObjectName("groupTitle")
         
         # Close button
         self.close_btn = QtWidgets.QToolButton()
-        self.close_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_TitleBarCloseButton))
-        self.close_btn.setStyleSheet("QToolButton { background-color: transparent; }")
+        self.close_btn.setIcon(standard_icon(QtWidgets.QStyle.SP_TitleBarCloseButton))
+        self.close_btn.setObjectName("groupClose")
         self.close_btn.setFixedSize(16, 16)
         
         # Add widgets to header layout
@@ -114,22 +159,30 @@ class ParentGroupWidget(QtWidgets.QWidget):
     def update_style(self):
         """Update the widget style based on color and transparency"""
         r, g, b = self.bg_color
-        a = self.bg_transparency
-        self.setStyleSheet(f"""
-            ParentGroupWidget {{
-                background-color: rgba({r}, {g}, {b}, {a});
-                border-radius: 5px;
-                border: 1px solid #aa7;
-            }}
-        """)
+        self.setStyleSheet(_style_for(r, g, b, self.bg_transparency))
+    
+    def set_drop_hover(self, hover):
+        """Toggle the drop highlight through the dropHover property"""
+        if bool(self.property("dropHover")) == hover:
+            return
+        
+        # Re-polish so the [dropHover="true"] rule is picked up
+        self.setProperty("dropHover", hover)
+        self.style().unpolish(self)
+        self.style().polish(self)
     
     def set_color(self, r, g, b):
         """Set the background color of the widget"""
-        self.bg_color = [r, g, b]
+        new_color = [r, g, b]
+        if new_color == self.bg_color:
+            return
+        self.bg_color = new_color
         self.update_style()
     
     def set_transparency(self, transparency):
         """Set the transparency of the widget"""
+        if transparency == self.bg_transparency:
+            return
         self.bg_transparency = transparency
         self.update_style()
     
@@ -148,47 +201,33 @@ class ParentGroupWidget(QtWidgets.QWidget):
         if not self.expanded:
             return
         
-        # Get total height needed for all child sets
-        total_height = 40  # Header height
-        for child_widget in self.child_widgets.values():
-            child_height = child_widget.height() if child_widget.isVisible() else 0
-            total_height += child_height + 4  # Adding spacing
-        
-        # Add padding
-        total_height += 16
+        # Header height, cached child heights plus spacing, and padding
+        total_height = 40 + self._children_height_total + 4 * len(self.child_widgets) + 16
         
-        # Get maximum width needed
-        max_width = 300  # Default minimum width
-        for child_widget in self.child_widgets.values():
-            if child_widget.isVisible() and child_widget.width() > max_width:
-                max_width = child_widget.width()
-        
-        # Add padding
-        max_width += 24
+        # Default minimum width or the widest child, plus padding
+        max_width = max(300, self._children_max_width) + 24
         
         # Resize the group
         self.resize(max_width, total_height)
         
         # Notify parent of the size change
-        if hasattr(self.parent(), 'update_group_size'):
-            self.parent().update_group_size(self.group_name, max_width, total_height)
-        
-        # Update resize handle position
-        self.resize_handle.move(self.width() - 10, self.height() - 10)
+        if self.on_size_changed:
+            self.on_size_changed(self.group_name, max_width, total_height)
     
     def handle_resize(self, width, height):
         """Handle resize from the resize handle"""
         # Notify parent of the size change
-        if hasattr(self.parent(), 'update_group_size'):
-            self.parent().update_group_size(self.group_name, width, height)
-        
-        # Update resize handle position
-        self.resize_handle.move(self.width() - 10, self.height() - 10)
+        if self.on_size_changed:
+            self.on_size_changed(self.group_name, width, height)
     
     def resizeEvent(self, event):
         """Handle resize events"""
         super(ParentGroupWidget, self).resizeEvent(event)
-        # Update resize handle position
+        # Reposition the resize handle once the burst of resize events drains
+        self._relayout_timer.start()
+    
+    def _reposition_handle(self):
+        """Move the resize handle to the bottom-right corner"""
         self.resize_handle.move(self.width() - 10, self.height() - 10)
     
     def mousePressEvent(self, event):
@@ -197,6 +236,8 @@ class ParentGroupWidget(QtWidgets.QWidget):
             if self.header_widget.geometry().contains(event.pos()):
                 # Store the initial position for dragging
                 self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
+                self._press_pos = event.globalPos()
+                self._moved = False
                 # Also store that we're in a potential selection operation
                 self.click_without_drag = True
                 event.accept()
@@ -207,32 +248,50 @@ class ParentGroupWidget(QtWidgets.QWidget):
     
     def mouseMoveEvent(self, event):
         if event.buttons() == QtCore.Qt.LeftButton and self.drag_position:
-            # We're dragging, so this isn't a click-to-select operation
-            if hasattr(self, 'click_without_drag'):
-                self.click_without_drag = False
+            if not self._moved:
+                # Ignore jitter until the cursor leaves the click threshold
+                if (event.globalPos() - self._press_pos).manhattanLength() < self.MOVE_THRESHOLD:
+                    event.accept()
+                    return
+                self._moved = True
             
-            # Move the widget during drag
-            new_pos = event.globalPos() - self.drag_position
-            self.move(new_pos)
+            # We're dragging, so this isn't a click-to-select operation
+            self.click_without_drag = False
             
-            # Notify parent of the position change
-            if hasattr(self.parent(), 'update_group_position'):
-                self.parent().update_group_position(self.group_name, new_pos.x(), new_pos.y())
+            # Store the latest position, the timer applies it
+            self._pending_pos = event.globalPos() - self.drag_position
+            if not self._move_timer.isActive():
+                self._move_timer.start()
             
             event.accept()
         super(ParentGroupWidget, self).mouseMoveEvent(event)
     
+    def _flush_move(self):
+        """Apply the latest pending drag position"""
+        if self._pending_pos is None:
+            return
+        
+        new_pos = self._pending_pos
+        self._pending_pos = None
+        self.move(new_pos)
+        
+        # Notify parent of the position change
+        if self.on_position_changed:
+            self.on_position_changed(self.group_name, new_pos.x(), new_pos.y())
+    
     def mouseReleaseEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
+            # Apply any move still waiting on the timer, every flush already
+            # stored its position in the manager
+            self._move_timer.stop()
+            self._flush_move()
+            
             # Clear the drag position
             self.drag_position = None
             
-            # Update the position in the manager
-            if hasattr(self.parent(), 'update_group_position'):
-                self.parent().update_group_position(self.group_name, self.pos().x(), self.pos().y())
-            
             # Reset the click state
             self.click_without_drag = False
+            self._moved = False
         super(ParentGroupWidget, self).mouseReleaseEvent(event)
     
     def update_label(self, new_name):
@@ -242,6 +301,7 @@ class ParentGroupWidget(QtWidgets.QWidget):
     def add_set_widget(self, set_name, widget):
         """Add a set widget to this parent group"""
         self.child_widgets[set_name] = widget
+        self._store_child_extent(set_name, widget)
         
         # Update size if expanded
         if self.expanded:
@@ -251,47 +311,100 @@ class ParentGroupWidget(QtWidgets.QWidget):
         """Remove a set widget from this parent group"""
         if set_name in self.child_widgets:
             del self.child_widgets[set_name]
+            self._drop_child_extent(set_name)
             
             # Update size if expanded
             if self.expanded:
                 self.update_size_for_children()
     
+    def update_child_extent(self, set_name):
+        """Refresh the cached size of a child set widget after it was resized, shown or hidden"""
+        widget = self.child_widgets.get(set_name)
+        if widget is None:
+            return
+        
+        old_extent = self._child_extents.get(set_name)
+        self._store_child_extent(set_name, widget)
+        if self._child_extents[set_name] == old_extent:
+            return
+        if self.expanded:
+            self.update_size_for_children()
+    
+    def _store_child_extent(self, set_name, widget):
+        """Cache a child's size and fold it into the running totals"""
+        self._drop_child_extent(set_name)
+        
+        # Hidden children take no room, matching the layout. isHidden() only
+        # reflects the widget's own state, not whether the window is shown.
+        if not widget.isHidden():
+            height, width = widget.height(), widget.width()
+        else:
+            height, width = 0, 0
+        
+        self._child_extents[set_name] = (height, width)
+        self._children_height_total += height
+        if width > self._children_max_width:
+            self._children_max_width = width
+    
+    def _drop_child_extent(self, set_name):
+        """Remove a child's cached size from the running totals"""
+        extent = self._child_extents.pop(set_name, None)
+        if extent is None:
+            return
+        
+        height, width = extent
+        self._children_height_total -= height
+        if width >= self._children_max_width:
+            # The widest child left, rescan the cached widths (no Qt calls)
+            self._children_max_width = max(
+                (w for _, w in self._child_extents.values()), default=0
+            )
+    
     def request_deletion(self):
-        if hasattr(self.parent(), 'delete_group_widget'):
-            self.parent().delete_group_widget(self.group_name)
+        if self.on_delete_requested:
+            self.on_delete_requested(self.group_name)
     
     def show_context_menu(self, position):
         """Show context menu for this group widget"""
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        
+        # Show the menu at the specified position
+        self._context_menu.exec_(self.mapToGlobal(position))
+    
+    def _build_context_menu(self):
+        """Build the context menu once, its actions act on the current group name"""
         menu = QtWidgets.QMenu(self)
         
         # Add rename option
         rename_action = menu.addAction("Rename Group")
-        rename_action.triggered.connect(lambda: self.parent().rename_group_widget(self.group_name))
+        rename_action.triggered.connect(self._rename_from_menu)
         
         # Add color submenu
-        parent_widget = self.parent()
-        color_menu = get_color_menu(
-            "Set Color", 
-            self, 
-            lambda r, g, b: parent_widget.set_group_color(self.group_name, r, g, b)
-        )
+        color_menu = get_color_menu("Set Color", self, self._set_color_from_menu)
         menu.addMenu(color_menu)
         
         # Add transparency submenu
         transp_menu = get_transparency_menu(
-            "Set Transparency", 
-            self, 
-            lambda t: parent_widget.update_group_transparency(self.group_name, t)
+            "Set Transparency", self, self._set_transparency_from_menu
         )
         menu.addMenu(transp_menu)
         
         # Add delete option
         menu.addSeparator()
         delete_action = menu.addAction("Delete Group")
-        delete_action.triggered.connect(lambda: self.request_deletion())
+        delete_action.triggered.connect(self.request_deletion)
         
-        # Show the menu at the specified position
-        menu.exec_(self.mapToGlobal(position))
+        return menu
+    
+    def _rename_from_menu(self):
+        self.parent().rename_group_widget(self.group_name)
+    
+    def _set_color_from_menu(self, r, g, b):
+        self.parent().set_group_color(self.group_name, r, g, b)
+    
+    def _set_transparency_from_menu(self, transparency):
+        self.parent().update_group_transparency(self.group_name, transparency)
     
     # Drop event handlers
     def dragEnterEvent(self, event):
@@ -300,21 +413,15 @@ class ParentGroupWidget(QtWidgets.QWidget):
         mime_data = event.mimeData()
         if mime_data.hasText():
             set_name = mime_data.text()
-            if hasattr(self.parent(), 'set_widgets') and set_name in self.parent().set_widgets:
+            if self.accepts_set and self.accepts_set(set_name):
                 event.acceptProposedAction()
                 # Highlight the group to indicate it can accept the drop
-                self.setStyleSheet(f"""
-                    ParentGroupWidget {{
-                        background-color: rgba({self.bg_color[0]}, {self.bg_color[1]}, {self.bg_color[2]}, {self.bg_transparency});
-                        border-radius: 5px;
-                        border: 2px solid #ff0;
-                    }}
-                """)
+                self.set_drop_hover(True)
         
     def dragLeaveEvent(self, event):
         """Handle drag leave event"""
         # Reset the highlight
-        self.update_style()
+        self.set_drop_hover(False)
         
     def dropEvent(self, event):
         """Handle drop event"""
@@ -323,8 +430,8 @@ class ParentGroupWidget(QtWidgets.QWidget):
             set_name = mime_data.text()
             
             # Add the set to this group
-            if hasattr(self.parent(), 'set_widgets') and set_name in self.parent().set_widgets:
-                self.parent().add_set_to_group(set_name, self.group_name)
+            if self.accepts_set and self.accepts_set(set_name):
+                self.on_set_dropped(set_name, self.group_name)
                 event.acceptProposedAction()
                 
                 # Show a feedback message
@@ -334,4 +441,4 @@ class ParentGroupWidget(QtWidgets.QWidget):
                 )
                 
         # Reset highlight
-        self.update_style()
\ No newline at end of file
+        self.set_drop_hover(False)
\ No newline at end of file
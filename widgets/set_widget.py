@@ -10,34 +10,79 @@ import maya.cmds as cmds
 from PySide2 import QtCore, QtWidgets, QtGui
 import math
 from functools import partial
+from itertools import count
 
 from SelectionSetManager.widgets.base_widgets import ResizeHandle, get_color_menu, get_transparency_menu, show_color_picker
+from SelectionSetManager.utils import standard_icon
+
+# Border drawn around every set widget, the fill comes from the set color
+_BORDER_PEN = QtGui.QPen(QtGui.QColor(0x77, 0x77, 0x77), 1)
+_CORNER_RADIUS = 5
+
+# Unique QPixmapCache keys for the drag image of each set widget
+_drag_key_ids = count()
 
 class DraggableSetWidget(QtWidgets.QWidget):
     """Custom draggable widget for each set in the workspace"""
     
+    # Emitted with the long name of an object clicked in the object list
+    objectClicked = QtCore.Signal(str)
+    
     def __init__(self, set_name, parent=None):
         super(DraggableSetWidget, self).__init__(parent)
         self.set_name = set_name
         self.expanded = False
         self.drag_position = None
         self.click_without_drag = False
+        self._drag_thresh = QtWidgets.QApplication.startDragDistance()
+        # Half size drag image, kept in QPixmapCache under this key from the
+        # first drag and dropped when the look changes
+        self._drag_key = f"setDrag:{next(_drag_key_ids)}"
+        
+        # Coalesce drag moves to one per frame (~60 Hz), the latest position wins
+        self._pending_pos = None
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)
+        
+        # Coalesce resize events into one handle move and size notification
+        self._size_changed = False
+        self._relayout_timer = QtCore.QTimer(self)
+        self._relayout_timer.setSingleShot(True)
+        self._relayout_timer.setInterval(0)
+        self._relayout_timer.timeout.connect(self._apply_resize)
+        
+        # Set while the workspace moves this widget, see move_quietly
+        self._in_programmatic_move = False
+        
+        # Header rectangle, measured on the next press after a relayout
+        self._header_rect = None
+        
+        # Callbacks registered by the workspace
+        self.on_edges_changed = None  # (set_name), moved or resized by the user
+        self.on_extent_changed = None  # (set_name), shown or hidden
+        self.on_size_changed = None  # (set_name, width, height)
+        
+        # Context menu, its name lists are kept until the workspace set or
+        # group names change
+        self._ctx_menu = None
+        self._ctx_revisions = None
         
         # Set minimum size
         self.setMinimumSize(100, 30)
         self.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
         
-        # Enable positioning and drag/drop
-        self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
-        self.setAutoFillBackground(True)
-        self.setAcceptDrops(True)
-        
-        # Enable drag and drop
-        self.setMouseTracking(True)
+        # No per-widget flags are needed: the background is drawn in
+        # paintEvent, static child styling lives in the dialog stylesheet,
+        # drops are handled by the workspace and moves only matter while a
+        # button is held, which Qt delivers without mouse tracking.
         
         # Default styling
-        self.bg_color = [70, 70, 70]
+        self.bg_color = (70, 70, 70)
         self.bg_transparency = 180
+        # Fill color handed to the painter, updated in place
+        self._bg_qcolor = QtGui.QColor(70, 70, 70, 180)
         
         self.createUI()
     
@@ -49,30 +94,24 @@ class DraggableSetWidget(QtWidgets.QWidget):
         
         # Header layout with title bar styling
         self.header_widget = QtWidgets.QWidget()
-        self.header_widget.setStyleSheet("""
-            QWidget {
-                background-color: #3a3a3a;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-        """)
+        self.header_widget.setObjectName("setHeader")
         header_layout = QtWidgets.QHBoxLayout(self.header_widget)
         header_layout.setContentsMargins(8, 2, 8, 2)
         
         # Expand/collapse button
         self.expand_btn = QtWidgets.QToolButton()
         self.expand_btn.setArrowType(QtCore.Qt.RightArrow)
-        self.expand_btn.setStyleSheet("QToolButton { background-color: transparent; }")
+        self.expand_btn.setObjectName("setExpand")
         self.expand_btn.setFixedSize(16, 16)
         
         # Set name label
         self.label = QtWidgets.QLabel(self.set_name)
-        self.label.setStyleSheet("QLabel { font-weight: bold; color: #ddd; }")
+        self.label.setObjectName("setTitle")
         
         # Close button
         self.close_btn = QtWidgets.QToolButton()
-        self.close_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_TitleBarCloseButton))
-        self.close_btn.setStyleSheet("QToolButton { background-color: transparent; }")
+        self.close_btn.setIcon(standard_icon(QtWidgets.QStyle.SP_TitleBarCloseButton))
+        self.close_btn.setObjectName("setClose")
         self.close_btn.setFixedSize(16, 16)
         
         # Add widgets to header layout
@@ -81,43 +120,13 @@ class DraggableSetWidget(QtWidgets.QWidget):
         header_layout.addStretch()
         header_layout.addWidget(self.close_btn)
         
-        # Content widget (hidden by default)
-        self.content_widget = QtWidgets.QWidget()
-        self.content_layout = QtWidgets.QVBoxLayout(self.content_widget)
-        self.content_layout.setContentsMargins(4, 4, 4, 4)
-        self.content_layout.setSpacing(4)
-        self.content_widget.setVisible(False)
-        
-        # Add list widget for objects
-        self.object_list = QtWidgets.QListWidget()
-        self.object_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
-        self.object_list.setDragEnabled(False)
-        self.object_list.setAlternatingRowColors(True)
-        self.object_list.setStyleSheet("""
-            QListWidget {
-                background-color: rgba(50, 50, 50, 120);
-                border-radius: 3px;
-                border: 1px solid #555;
-                padding: 2px;
-            }
-            QListWidget::item {
-                padding: 2px;
-            }
-            QListWidget::item:hover {
-                background-color: rgba(100, 100, 100, 120);
-            }
-            QListWidget::item:selected {
-                background-color: rgba(0, 160, 230, 120);
-            }
-            QListWidget::item:alternate {
-                background-color: rgba(60, 60, 60, 120);
-            }
-        """)
-        self.content_layout.addWidget(self.object_list)
+        # Content widget with the object list, built on first expansion
+        self.content_widget = None
+        self.object_list = None
+        self._pending_objects = []
         
         # Add layouts to main layout
         self.main_layout.addWidget(self.header_widget)
-        self.main_layout.addWidget(self.content_widget)
         
         # Add resize handle
         self.resize_handle = ResizeHandle(self)
@@ -129,62 +138,153 @@ class DraggableSetWidget(QtWidgets.QWidget):
         self.expand_btn.clicked.connect(self.toggle_expansion)
         self.close_btn.clicked.connect(self.request_deletion)
         
-        # Position resize handle
-        self.resize_handle.move(self.width() - 10, self.height() - 10)
+        # The resize handle is positioned by _apply_resize once the widget
+        # gets its first real size
+    
+    def _ensure_content_built(self):
+        """Build the content widget and object list the first time they are needed"""
+        if self.content_widget is not None:
+            return
+        
+        # Content widget (hidden by default)
+        self.content_widget = QtWidgets.QWidget()
+        self.content_layout = QtWidgets.QVBoxLayout(self.content_widget)
+        self.content_layout.setContentsMargins(4, 4, 4, 4)
+        self.content_layout.setSpacing(4)
+        self.content_widget.setVisible(False)
+        
+        # Add list view for objects
+        self.object_list = QtWidgets.QListView()
+        self._obj_model = QtGui.QStandardItemModel(self.object_list)
+        self.object_list.setModel(self._obj_model)
+        self.object_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.object_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.object_list.setDragEnabled(False)
+        self.object_list.setAlternatingRowColors(True)
+        self.object_list.setUniformItemSizes(True)
+        self.object_list.setObjectName("setObjects")
+        self.object_list.clicked.connect(self._emit_object_clicked)
+        self.content_layout.addWidget(self.object_list)
+        self.main_layout.addWidget(self.content_widget)
+        # The content is created after the resize handle, keep the handle on top
+        self.resize_handle.raise_()
+        
+        # Fill in the objects set while the list did not exist
+        self._fill_objects(self._pending_objects)
+        self._pending_objects = []
     
     def update_style(self):
-        """Update the widget style based on color and transparency"""
+        """Update the background color from color and transparency"""
         r, g, b = self.bg_color
-        a = self.bg_transparency
-        self.setStyleSheet(f"""
-            DraggableSetWidget {{
-                background-color: rgba({r}, {g}, {b}, {a});
-                border-radius: 5px;
-                border: 1px solid #777;
-            }}
-        """)
+        self._bg_qcolor.setRgb(r, g, b, self.bg_transparency)
+        QtGui.QPixmapCache.remove(self._drag_key)
+        self.update()
+    
+    def paintEvent(self, event):
+        """Draw the rounded, bordered background in the set color"""
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(_BORDER_PEN)
+        painter.setBrush(self._bg_qcolor)
+        painter.drawRoundedRect(QtCore.QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5),
+                                _CORNER_RADIUS, _CORNER_RADIUS)
     
     def set_color(self, r, g, b):
         """Set the background color of the widget"""
-        self.bg_color = [r, g, b]
+        new_color = (r, g, b)
+        if new_color == self.bg_color:
+            return
+        self.bg_color = new_color
         self.update_style()
     
     def set_transparency(self, transparency):
         """Set the transparency of the widget"""
+        if transparency == self.bg_transparency:
+            return
         self.bg_transparency = transparency
         self.update_style()
     
     def toggle_expansion(self):
         self.expanded = not self.expanded
+        self._ensure_content_built()
         self.content_widget.setVisible(self.expanded)
         arrow_type = QtCore.Qt.DownArrow if self.expanded else QtCore.Qt.RightArrow
         self.expand_btn.setArrowType(arrow_type)
+        QtGui.QPixmapCache.remove(self._drag_key)
+        self._header_rect = None
         
         # Adjust size based on expansion state
         if self.expanded:
             current_size = self.size()
             if current_size.height() < 100:
+                # Report it like a handle resize so the manager and any
+                # group holding this set see the new size
+                self._size_changed = True
                 self.resize(current_size.width(), 200)
     
     def handle_resize(self, width, height):
         """Handle resize from the resize handle"""
-        # Notify parent of the size change
-        if hasattr(self.parent(), 'update_widget_size'):
-            self.parent().update_widget_size(self.set_name, width, height)
-        
-        # Update resize handle position
-        self.resize_handle.move(self.width() - 10, self.height() - 10)
+        # Notify parent of the size change once the burst of resizes drains
+        self._size_changed = True
+        self._relayout_timer.start()
     
     def resizeEvent(self, event):
         """Handle resize events"""
         super(DraggableSetWidget, self).resizeEvent(event)
-        # Update resize handle position
-        self.resize_handle.move(self.width() - 10, self.height() - 10)
+        QtGui.QPixmapCache.remove(self._drag_key)
+        self._header_rect = None
+        if self.on_edges_changed:
+            self.on_edges_changed(self.set_name)
+        # Reposition the resize handle once the burst of resize events drains
+        self._relayout_timer.start()
+    
+    def moveEvent(self, event):
+        """Let the workspace drop the cached connections of this set"""
+        super(DraggableSetWidget, self).moveEvent(event)
+        if self._in_programmatic_move:
+            return
+        if self.on_edges_changed:
+            self.on_edges_changed(self.set_name)
+    
+    def showEvent(self, event):
+        """Let the group holding this set count it again"""
+        super(DraggableSetWidget, self).showEvent(event)
+        self._report_extent()
+    
+    def hideEvent(self, event):
+        """Let the group holding this set stop counting it"""
+        super(DraggableSetWidget, self).hideEvent(event)
+        self._report_extent()
+    
+    def _report_extent(self):
+        if self.on_extent_changed:
+            self.on_extent_changed(self.set_name)
+    
+    def move_quietly(self, x, y):
+        """Move without notifying the workspace, for moves the workspace makes itself"""
+        self._in_programmatic_move = True
+        try:
+            self.move(x, y)
+        finally:
+            self._in_programmatic_move = False
+    
+    def _apply_resize(self):
+        """Move the resize handle and report a handle-driven size change"""
+        width, height = self.width(), self.height()
+        self.resize_handle.move(width - 10, height - 10)
+        
+        if self._size_changed:
+            self._size_changed = False
+            if self.on_size_changed:
+                self.on_size_changed(self.set_name, width, height)
     
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
-            # Check if the click is on the header
-            if self.header_widget.geometry().contains(event.pos()):
+            # Check if the click is on the header, the layout margins around
+            # it do not count
+            if self._header_rect is None:
+                self._header_rect = self.header_widget.geometry()
+            if self._header_rect.contains(event.pos()):
                 # Store the initial position for dragging
                 self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
                 # Also store that we're in a potential selection operation
@@ -204,17 +304,30 @@ class DraggableSetWidget(QtWidgets.QWidget):
             if hasattr(self, 'click_without_drag'):
                 self.click_without_drag = False
             
-            # Start drag operation if moving beyond threshold
-            if (event.pos() - self.drag_position).manhattanLength() > QtWidgets.QApplication.startDragDistance():
+            # Start drag operation if moving beyond threshold, this is not throttled
+            delta = event.pos() - self.drag_position
+            if abs(delta.x()) + abs(delta.y()) > self._drag_thresh:
+                self._move_timer.stop()
+                self._pending_pos = None
                 self.startDrag(event.globalPos())
                 return
             
-            # Move the widget during drag
-            new_pos = event.globalPos() - self.drag_position
-            self.move(new_pos)
+            # Store the latest position, the timer applies it
+            self._pending_pos = event.globalPos() - self.drag_position
+            if not self._move_timer.isActive():
+                self._move_timer.start()
             event.accept()
         super(DraggableSetWidget, self).mouseMoveEvent(event)
     
+    def _flush_move(self):
+        """Apply the latest pending drag position"""
+        if self._pending_pos is None:
+            return
+        
+        new_pos = self._pending_pos
+        self._pending_pos = None
+        self.move(new_pos)
+    
     def startDrag(self, global_pos):
         """Start dragging this set widget"""
         # Create drag object
@@ -225,13 +338,20 @@ class DraggableSetWidget(QtWidgets.QWidget):
         mime_data.setText(self.set_name)
         mime_data.setObjectName("set_widget")
         
-        # Create a pixmap of this widget for the drag image
-        pixmap = self.grab()
+        # Use a half size pixmap of this widget for the drag image, it is
+        # only a cursor image so it is regrabbed only after the widget changes
+        pixmap = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(self._drag_key, pixmap):
+            pixmap = self.grab().scaled(
+                self.width() // 2, self.height() // 2,
+                QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+            )
+            QtGui.QPixmapCache.insert(self._drag_key, pixmap)
         drag.setPixmap(pixmap)
         drag.setMimeData(mime_data)
         
-        # Set hotspot to the cursor position
-        drag.setHotSpot(self.drag_position)
+        # Set hotspot to the cursor position on the scaled image
+        drag.setHotSpot(self.drag_position / 2)
         
         # Execute the drag
         result = drag.exec_(QtCore.Qt.MoveAction)
@@ -241,6 +361,10 @@ class DraggableSetWidget(QtWidgets.QWidget):
     
     def mouseReleaseEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
+            # Apply any move still waiting on the timer
+            self._move_timer.stop()
+            self._flush_move()
+            
             # Clear the drag position
             self.drag_position = None
             
@@ -258,87 +382,141 @@ class DraggableSetWidget(QtWidgets.QWidget):
     def update_label(self, new_name):
         self.set_name = new_name
         self.label.setText(new_name)
+        QtGui.QPixmapCache.remove(self._drag_key)
     
     def set_objects(self, objects):
-        self.object_list.clear()
+        QtGui.QPixmapCache.remove(self._drag_key)
+        if self.object_list is None:
+            # Keep them until the list is built on first expansion
+            self._pending_objects = list(objects)
+            return
+        self._fill_objects(objects)
+    
+    def _fill_objects(self, objects):
+        """Replace the rows of the object list"""
+        items = []
         for obj in objects:
             # Display short name but store long name
-            short_name = obj.split("|")[-1]
-            item = QtWidgets.QListWidgetItem(short_name)
-            item.setData(QtCore.Qt.UserRole, obj)
-            self.object_list.addItem(item)
+            item = QtGui.QStandardItem(obj.rpartition("|")[2])
+            item.setData(obj, QtCore.Qt.UserRole)
+            items.append(item)
+        
+        # Swap the rows in one go so the view updates once
+        self._obj_model.clear()
+        if items:
+            self._obj_model.invisibleRootItem().appendRows(items)
+    
+    def _emit_object_clicked(self, index):
+        """Report the long name stored on the clicked object row"""
+        self.objectClicked.emit(index.data(QtCore.Qt.UserRole))
     
     def request_deletion(self):
         self.parent().delete_widget(self.set_name)
     
     def show_context_menu(self, position):
         """Show context menu for this set widget"""
+        if self._ctx_menu is None:
+            self._ctx_menu = self._build_context_menu()
+        
+        # Show the menu without blocking, its submenus are filled on aboutToShow
+        self._ctx_menu.popup(self.mapToGlobal(position))
+    
+    def _build_context_menu(self):
+        """Build the context menu with only the actions that never change"""
         menu = QtWidgets.QMenu(self)
         
         # Add actions
         select_action = menu.addAction("Select All Objects")
-        select_action.triggered.connect(lambda: self.parent().select_set(self.set_name))
+        select_action.triggered.connect(self._select_all)
         
         rename_action = menu.addAction("Rename Set")
-        rename_action.triggered.connect(lambda: self.parent().rename_widget(self.set_name))
+        rename_action.triggered.connect(self._rename)
+        
+        # Submenus are inserted above this separator
+        self._ctx_delete_separator = menu.addSeparator()
+        
+        # Add delete option
+        delete_action = menu.addAction("Delete Set")
+        delete_action.triggered.connect(self.request_deletion)
         
-        # Add color submenu
+        menu.aboutToShow.connect(self._populate_dynamic_menu)
+        return menu
+    
+    def _populate_dynamic_menu(self):
+        """Add the submenus on first show, refill the name lists when they are stale"""
+        # The parent and group lists only hold set and group names, so they
+        # are refilled only after the workspace reports one of those changed
         parent_widget = self.parent()
-        color_menu = get_color_menu(
-            "Set Color", 
-            self, 
-            lambda r, g, b: parent_widget.update_widget_color(self.set_name, r, g, b)
-        )
-        menu.addMenu(color_menu)
-        
-        # Add transparency submenu
-        transp_menu = get_transparency_menu(
-            "Set Transparency", 
-            self, 
-            lambda t: parent_widget.update_widget_transparency(self.set_name, t)
-        )
-        menu.addMenu(transp_menu)
-        
-        # Add parent submenu
-        parent_menu = menu.addMenu("Set Parent")
+        revisions = (parent_widget.sets_revision, parent_widget.groups_revision)
+        if revisions == self._ctx_revisions:
+            return
+        
+        menu = self._ctx_menu
+        if self._ctx_revisions is None:
+            before = self._ctx_delete_separator
+            
+            # Add color submenu
+            color_menu = get_color_menu(
+                "Set Color", 
+                self, 
+                lambda r, g, b: parent_widget.update_widget_color(self.set_name, r, g, b)
+            )
+            menu.insertMenu(before, color_menu)
+            
+            # Add transparency submenu
+            transp_menu = get_transparency_menu(
+                "Set Transparency", 
+                self, 
+                lambda t: parent_widget.update_widget_transparency(self.set_name, t)
+            )
+            menu.insertMenu(before, transp_menu)
+            
+            # Add parent and group submenus
+            self._parent_menu = QtWidgets.QMenu("Set Parent", menu)
+            menu.insertMenu(before, self._parent_menu)
+            self._group_menu = QtWidgets.QMenu("Add to Group", menu)
+            menu.insertMenu(before, self._group_menu)
+        self._ctx_revisions = revisions
+        
+        parent_menu = self._parent_menu
+        parent_menu.clear()
         
         # No parent option
         none_action = parent_menu.addAction("None")
-        none_action.triggered.connect(
-            lambda: parent_widget.set_widget_parent(self.set_name, None)
-        )
+        none_action.triggered.connect(partial(self._set_parent, None))
         
         # List all potential parents (other sets)
         parent_menu.addSeparator()
         for other_name in parent_widget.set_widgets:
             if other_name != self.set_name:
                 action = parent_menu.addAction(other_name)
-                action.triggered.connect(
-                    partial(parent_widget.set_widget_parent, self.set_name, other_name)
-                )
+                action.triggered.connect(partial(self._set_parent, other_name))
         
-        # Add to group submenu
-        group_menu = menu.addMenu("Add to Group")
+        group_menu = self._group_menu
+        group_menu.clear()
         
         # No group option
         none_group_action = group_menu.addAction("None (Remove from Groups)")
-        none_group_action.triggered.connect(
-            lambda: parent_widget.remove_set_from_group(self.set_name)
-        )
+        none_group_action.triggered.connect(self._remove_from_group)
         
         # List all available groups
         if parent_widget.group_widgets:
             group_menu.addSeparator()
             for group_name in parent_widget.group_widgets:
                 action = group_menu.addAction(group_name)
-                action.triggered.connect(
-                    partial(parent_widget.add_set_to_group, self.set_name, group_name)
-                )
-        
-        # Add delete option
-        menu.addSeparator()
-        delete_action = menu.addAction("Delete Set")
-        delete_action.triggered.connect(lambda: self.request_deletion())
-        
-        # Show the menu at the specified position
-        menu.exec_(self.mapToGlobal(position))
\ No newline at end of file
+                action.triggered.connect(partial(self._add_to_group, group_name))
+    
+    def _select_all(self):
+        self.parent().select_set(self.set_name)
+    
+    def _rename(self):
+        self.parent().rename_widget(self.set_name)
+    
+    def _set_parent(self, parent_name, checked=False):
+        self.parent().set_widget_parent(self.set_name, parent_name)
+    
+    def _remove_from_group(self):
+        self.parent().remove_set_from_group(self.set_name)
+    
+    def _add_to_group(self, group_name, checked=False):
+        self.parent().add_set_to_group(self.set_name, group_name)
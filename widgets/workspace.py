@@ -10,11 +10,108 @@ import maya.cmds as cmds
 from PySide2 import QtCore, QtWidgets, QtGui
 import os
 import math
+from collections import deque
+from contextlib import contextmanager
 from functools import partial
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from widgets.set_widget import DraggableSetWidget
 from widgets.group_widget import ParentGroupWidget
 
+# Room for background images at full and workspace size, and set drag
+# images (in KiB)
+QtGui.QPixmapCache.setCacheLimit(64 * 1024)
+
+# Dashed pen for parent-child connections and the fill of their arrow heads
+_CONNECTION_COLOR = QtGui.QColor(200, 200, 200, 150)
+_CONNECTION_PEN = QtGui.QPen(_CONNECTION_COLOR, 2, QtCore.Qt.DashLine)
+_ARROW_BRUSH = QtGui.QBrush(_CONNECTION_COLOR)
+
+# Connection arrow heads: side length and the half angle of the tip
+_ARROW_SIZE = 8
+_ARROW_COS = math.cos(math.pi / 6)
+_ARROW_SIN = math.sin(math.pi / 6)
+# Room around a connection line for the arrow head and the pen
+_EDGE_MARGIN = _ARROW_SIZE + 2
+
+# Edges to compute at once before _edge_geometries switches to NumPy
+_NUMPY_EDGE_THRESHOLD = 32
+if np is not None:
+    # Rotations turning the scaled edge direction into the two arrow sides
+    _ARROW_ROTATIONS = np.array([
+        [[_ARROW_COS, _ARROW_SIN], [-_ARROW_SIN, _ARROW_COS]],
+        [[_ARROW_COS, -_ARROW_SIN], [_ARROW_SIN, _ARROW_COS]],
+    ])
+
+def _widget_center(widget):
+    """Center of a widget in its parent, from raw ints"""
+    return widget.x() + widget.width() / 2, widget.y() + widget.height() / 2
+
+def _edge_bounds(cx, cy, px, py):
+    """Area covered by a connection and its arrow head, for partial repaints"""
+    margin = _EDGE_MARGIN
+    return QtCore.QRect(int(min(cx, px)) - margin, int(min(cy, py)) - margin,
+                        int(abs(cx - px)) + 2 * margin + 1, int(abs(cy - py)) + 2 * margin + 1)
+
+def _edge_geometry(cx, cy, px, py):
+    """Connection line from a child center to a parent center and the arrow head at the child"""
+    child_center = QtCore.QPointF(cx, cy)
+    line = QtCore.QLineF(child_center, QtCore.QPointF(px, py))
+    
+    # Arrow head at the child, the unit direction from the parent rotated
+    # by the fixed tip angle either way
+    dx, dy = cx - px, cy - py
+    length = math.hypot(dx, dy)
+    if not length:
+        return line, None
+    ux, uy = _ARROW_SIZE * dx / length, _ARROW_SIZE * dy / length
+    arrow = QtGui.QPolygonF([
+        child_center,
+        QtCore.QPointF(cx - ux * _ARROW_COS - uy * _ARROW_SIN,
+                       cy - uy * _ARROW_COS + ux * _ARROW_SIN),
+        QtCore.QPointF(cx - ux * _ARROW_COS + uy * _ARROW_SIN,
+                       cy - uy * _ARROW_COS - ux * _ARROW_SIN),
+        child_center,
+    ])
+    return line, arrow
+
+def _edge_geometries(edges):
+    """_edge_geometry for a list of (cx, cy, px, py) center tuples
+    
+    Large batches, like the first paint after an import, are computed in
+    one vectorized pass when NumPy is available.
+    """
+    if np is None or len(edges) <= _NUMPY_EDGE_THRESHOLD:
+        return [_edge_geometry(*edge) for edge in edges]
+    
+    # Child and parent centers, one row per edge
+    centers = np.array(edges, dtype=float)
+    child = centers[:, 0:2]
+    parent = centers[:, 2:4]
+    
+    # Edge directions scaled to the arrow size, zero length edges get no arrow
+    delta = child - parent
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    has_arrow = length > 0
+    scaled = delta * (_ARROW_SIZE / np.where(has_arrow, length, 1.0))[:, None]
+    
+    # Both arrow side points per edge, shape (edges, 2, 2)
+    tips = child[:, None, :] - np.einsum('kij,nj->nki', _ARROW_ROTATIONS, scaled)
+    
+    QPointF = QtCore.QPointF
+    geometries = []
+    for (cx, cy, px, py), ((x1, y1), (x2, y2)), arrow_ok in zip(
+            edges, tips.tolist(), has_arrow.tolist()):
+        center = QPointF(cx, cy)
+        line = QtCore.QLineF(center, QPointF(px, py))
+        arrow = QtGui.QPolygonF([center, QPointF(x1, y1), QPointF(x2, y2), center]) if arrow_ok else None
+        geometries.append((line, arrow))
+    return geometries
+
 class SelectionSetWorkspace(QtWidgets.QWidget):
     """Workspace area for all draggable set widgets"""
     
@@ -22,6 +119,10 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
         super(SelectionSetWorkspace, self).__init__(parent)
         self.set_widgets = {}  # To store references to set widgets
         self.group_widgets = {}  # To store references to parent group widgets
+        # Bumped whenever set or group names come or go, set widgets use them
+        # to tell when their cached context menu is stale
+        self.sets_revision = 0
+        self.groups_revision = 0
         self.manager = None
         self.drag_start_pos = None
         self.multi_selection = False
@@ -33,6 +134,48 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
         # Background image properties
         self.background_image = None
         self.background_pixmap = None
+        # Pixmap cache key of the image, versioned by file time and size so
+        # an image rewritten at the same path is decoded again
+        self._bg_cache_key = None
+        # Background scaled to the workspace and its top-left corner, redone
+        # only when the image or the workspace size changes
+        self._scaled_bg = None
+        self._bg_pos = QtCore.QPoint()
+        # While the workspace is being resized the background is scaled with
+        # the fast filter, a smooth pass follows once resizing pauses
+        self._smooth_bg_timer = QtCore.QTimer(self)
+        self._smooth_bg_timer.setSingleShot(True)
+        self._smooth_bg_timer.setInterval(200)
+        self._smooth_bg_timer.timeout.connect(self._rescale_background)
+        
+        # Coalesce connection repaints and child follow-ups to one per frame
+        # (~60 Hz). Parents whose children still have to follow are kept
+        # here with the position they had before the first pending move.
+        # Plain moves repaint only their connections, the whole workspace is
+        # repainted when children moved or the hierarchy changed.
+        self._dirty_parents = {}
+        self._full_repaint = False
+        self._repaint_timer = QtCore.QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_repaint)
+        
+        # Connection line, arrow head and bounds per (child, parent) edge, dropped
+        # when either set moves or resizes and cleared when the sets change
+        self._edge_geom = {}
+        self._edge_geom_revision = self.sets_revision
+        
+        # Objects clicked in set lists wait here briefly so a burst of clicks
+        # is selected with one command, in order and without duplicates
+        self._pending_select = {}
+        self._pending_select_add = False
+        self._select_timer = QtCore.QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(30)
+        self._select_timer.timeout.connect(self._flush_select)
+        
+        # Nesting depth of bulk() blocks, repaints wait until the outermost ends
+        self._bulk_depth = 0
     
     def set_manager(self, manager):
         self.manager = manager
@@ -40,62 +183,45 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
     def add_set_widget(self, set_name, pos_x=None, pos_y=None, width=None, height=None):
         """Add a new draggable set widget to the workspace"""
         set_widget = DraggableSetWidget(set_name, self)
+        set_rec = self.manager.sets[set_name]
         
-        # Set the objects
-        set_widget.set_objects(self.manager.sets[set_name])
+        # Register the callbacks the set uses on move, resize, show and hide
+        set_widget.on_edges_changed = self.invalidate_set_edges
+        set_widget.on_extent_changed = self.update_widget_extent
+        set_widget.on_size_changed = self.update_widget_size
         
-        # Set the color
-        if set_name in self.manager.set_colors:
-            r, g, b = self.manager.set_colors[set_name]
-            set_widget.set_color(r, g, b)
+        # Set the objects
+        set_widget.set_objects(set_rec.objects)
         
-        # Set the transparency
-        if set_name in self.manager.set_transparency:
-            set_widget.set_transparency(self.manager.set_transparency[set_name])
+        # Set the color and transparency
+        set_widget.set_color(*set_rec.color)
+        set_widget.set_transparency(set_rec.transparency)
         
-        # Position the widget
+        # Position the widget, the record always holds a position
         if pos_x is not None and pos_y is not None:
             set_widget.move(pos_x, pos_y)
-        elif set_name in self.manager.set_positions:
-            set_widget.move(self.manager.set_positions[set_name][0], 
-                           self.manager.set_positions[set_name][1])
         else:
-            # Default position, offset from the last widget
-            default_x = 20
-            default_y = 20
-            if self.set_widgets:
-                # Get the last position and add an offset
-                last_widgets = list(self.set_widgets.values())
-                last_widget = last_widgets[-1]
-                default_x = last_widget.pos().x() + 20
-                default_y = last_widget.pos().y() + 30
-            
-            set_widget.move(default_x, default_y)
-            self.manager.set_positions[set_name] = [default_x, default_y]
+            set_widget.move(set_rec.pos[0], set_rec.pos[1])
         
         # Size the widget
         if width is not None and height is not None:
             set_widget.resize(width, height)
-        elif set_name in self.manager.set_sizes:
-            set_widget.resize(self.manager.set_sizes[set_name][0], 
-                             self.manager.set_sizes[set_name][1])
+        else:
+            set_widget.resize(set_rec.size[0], set_rec.size[1])
         
         # Connect object list selection
-        set_widget.object_list.itemClicked.connect(
-            lambda item: self.select_object(item.data(QtCore.Qt.UserRole))
-        )
+        set_widget.objectClicked.connect(self.select_object)
         
         # Show the widget
         set_widget.show()
         
         # Store reference
         self.set_widgets[set_name] = set_widget
+        self.sets_revision += 1
         
         # Add context menu to the set widget
         set_widget.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        set_widget.customContextMenuRequested.connect(
-            lambda pos: set_widget.show_context_menu(pos)
-        )
+        set_widget.customContextMenuRequested.connect(set_widget.show_context_menu)
         
         # Make sure parent-child relationships are visually represented
         self.update_widget_parent_indicators()
@@ -106,62 +232,57 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
         """Add a new parent group widget to the workspace"""
         group_widget = ParentGroupWidget(group_name, self)
         
-        # Set the color
-        if group_name in self.manager.group_colors:
-            r, g, b = self.manager.group_colors[group_name]
-            group_widget.set_color(r, g, b)
+        # Register the callbacks the group uses on move, resize, delete and drop
+        group_widget.on_position_changed = self.update_group_position
+        group_widget.on_size_changed = self.update_group_size
+        group_widget.on_delete_requested = self.delete_group_widget
+        group_widget.accepts_set = self.set_widgets.__contains__
+        group_widget.on_set_dropped = self.add_set_to_group
+        
+        group_rec = self.manager.parent_groups[group_name]
         
-        # Set the transparency
-        if group_name in self.manager.group_transparency:
-            group_widget.set_transparency(self.manager.group_transparency[group_name])
+        # Set the color and transparency
+        group_widget.set_color(*group_rec.color)
+        group_widget.set_transparency(group_rec.transparency)
         
-        # Position the widget
+        # Position the widget, the record always holds a position
         if pos_x is not None and pos_y is not None:
             group_widget.move(pos_x, pos_y)
-        elif group_name in self.manager.group_positions:
-            group_widget.move(self.manager.group_positions[group_name][0], 
-                             self.manager.group_positions[group_name][1])
         else:
-            # Default position
-            default_x = 20
-            default_y = 20
-            group_widget.move(default_x, default_y)
-            self.manager.group_positions[group_name] = [default_x, default_y]
+            group_widget.move(group_rec.pos[0], group_rec.pos[1])
         
         # Size the widget
         if width is not None and height is not None:
             group_widget.resize(width, height)
-        elif group_name in self.manager.group_sizes:
-            group_widget.resize(self.manager.group_sizes[group_name][0], 
-                               self.manager.group_sizes[group_name][1])
+        else:
+            group_widget.resize(group_rec.size[0], group_rec.size[1])
         
         # Show the widget
         group_widget.show()
         
         # Store reference
         self.group_widgets[group_name] = group_widget
+        self.groups_revision += 1
         
         # Add context menu to the group widget
         group_widget.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        group_widget.customContextMenuRequested.connect(
-            lambda pos: group_widget.show_context_menu(pos)
-        )
+        group_widget.customContextMenuRequested.connect(group_widget.show_context_menu)
         
         # Initialize any child sets
-        if group_name in self.manager.parent_groups:
-            for set_name in self.manager.parent_groups[group_name]:
-                if set_name in self.set_widgets:
-                    group_widget.add_set_widget(set_name, self.set_widgets[set_name])
+        for set_name in group_rec.sets:
+            if set_name in self.set_widgets:
+                group_widget.add_set_widget(set_name, self.set_widgets[set_name])
         
         return group_widget
     
     def update_widget_position(self, set_name, x, y):
         """Update a widget's position in the manager"""
         if self.manager and set_name in self.set_widgets:
+            # Keep the position from before the move, children follow by the
+            # difference on the next flush
+            self._dirty_parents.setdefault(set_name, self.manager.sets[set_name].pos)
             self.manager.update_set_position(set_name, x, y)
-            
-            # If this is a parent, check if child widgets need to move
-            self.update_child_widget_positions(set_name)
+            self._schedule_repaint()
     
     def update_group_position(self, group_name, x, y):
         """Update a group's position in the manager"""
@@ -172,6 +293,16 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
         """Update a widget's size in the manager"""
         if self.manager and set_name in self.set_widgets:
             self.manager.update_set_size(set_name, width, height)
+            
+            # Let the group holding this set refresh its cached child size
+            self.update_widget_extent(set_name)
+    
+    def update_widget_extent(self, set_name):
+        """Refresh the cached size of a set in the group holding it"""
+        if self.manager:
+            group_widget = self.group_widgets.get(self.manager.group_of(set_name))
+            if group_widget is not None:
+                group_widget.update_child_extent(set_name)
     
     def update_group_size(self, group_name, width, height):
         """Update a group's size in the manager"""
@@ -216,6 +347,8 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
         # Update in manager
         result = self.manager.set_parent(child_name, parent_name)
         if result:
+            self._edge_geom.clear()
+            
             # Update visuals
             self.update_widget_parent_indicators()
             
@@ -229,7 +362,7 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
                     # Move child inside parent
                     new_x = parent_pos.x() + 20
                     new_y = parent_pos.y() + 40
-                    self.set_widgets[child_name].move(new_x, new_y)
+                    self.set_widgets[child_name].move_quietly(new_x, new_y)
                     self.manager.update_set_position(child_name, new_x, new_y)
     
     def is_inside_parent(self, child_name, parent_name):
@@ -247,40 +380,54 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
         # Check if child is inside parent
         return parent_rect.contains(child_rect)
     
-    def update_child_widget_positions(self, parent_name):
-        """Update positions of child widgets when parent is moved"""
-        if not self.manager:
-            return
-        
-        # Find all children of this parent
-        children = []
-        for child_name, child_parent in self.manager.set_parents.items():
-            if child_parent == parent_name:
-                children.append(child_name)
-        
-        if not children:
-            return
+    def update_child_widget_positions(self, parent_name, old_pos):
+        """Move the descendants of a moved parent by the same offset
+        
+        Children that were inside their parent before it moved follow it,
+        the same test is repeated down the hierarchy. Returns True when
+        any child was moved.
+        """
+        if not self.manager or parent_name not in self.set_widgets:
+            return False
         
+        # The offset is the same for the whole hierarchy
         parent_widget = self.set_widgets[parent_name]
-        parent_pos = parent_widget.pos()
+        dx = parent_widget.x() - old_pos[0]
+        dy = parent_widget.y() - old_pos[1]
+        if not dx and not dy:
+            return False
         
-        # Move children that need to stay with the parent
-        for child_name in children:
-            if child_name in self.set_widgets:
-                child_widget = self.set_widgets[child_name]
+        set_widgets = self.set_widgets
+        set_children = self.manager.set_children
+        update_set_position = self.manager.update_set_position
+        
+        # Breadth-first over the child index, each entry holds a parent and
+        # its rectangle before the move as raw ints
+        moved = False
+        queue = deque([(parent_name, old_pos[0], old_pos[1],
+                        parent_widget.width(), parent_widget.height())])
+        while queue:
+            name, px, py, pw, ph = queue.popleft()
+            for child_name in set_children.get(name, ()):
+                child_widget = set_widgets.get(child_name)
+                if child_widget is None:
+                    continue
                 
-                # Only move if the child is inside the parent
-                if self.is_inside_parent(child_name, parent_name):
-                    # Maintain relative position
-                    relative_x = child_widget.pos().x() - (parent_pos.x() - self.manager.set_positions[parent_name][0])
-                    relative_y = child_widget.pos().y() - (parent_pos.y() - self.manager.set_positions[parent_name][1])
-                    
-                    # Update position
-                    child_widget.move(relative_x, relative_y)
-                    self.manager.update_set_position(child_name, relative_x, relative_y)
-                    
-                    # Recursively update child's children
-                    self.update_child_widget_positions(child_name)
+                # Only move children that were inside the parent
+                cx, cy = child_widget.x(), child_widget.y()
+                cw, ch = child_widget.width(), child_widget.height()
+                if not (px <= cx and py <= cy and cx + cw <= px + pw and cy + ch <= py + ph):
+                    continue
+                
+                # Keep the position relative to the parent, the moved sets do
+                # not report back and their edges are dropped all at once below
+                child_widget.move_quietly(cx + dx, cy + dy)
+                update_set_position(child_name, cx + dx, cy + dy)
+                queue.append((child_name, cx, cy, cw, ch))
+                moved = True
+        if moved:
+            self._edge_geom.clear()
+        return moved
     
     def add_set_to_group(self, set_name, group_name):
         """Add a set to a parent group"""
@@ -325,53 +472,143 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
     def update_widget_parent_indicators(self):
         """Update visual indicators of parent-child relationships"""
         # This would be implemented with painting connections between widgets
-        self.update()
+        if not self._bulk_depth:
+            self._schedule_repaint(full=True)
+    
+    @contextmanager
+    def bulk(self):
+        """Add, remove or rebuild many widgets with a single repaint at the end
+        
+        Painting is held off for the block and parent indicator updates
+        are folded into one, blocks can be nested.
+        """
+        if not self._bulk_depth:
+            self.setUpdatesEnabled(False)
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                self.setUpdatesEnabled(True)
+                self._schedule_repaint(full=True)
+    
+    def invalidate_set_edges(self, set_name):
+        """Forget the cached connections to and from a set that moved
+        
+        Only the areas the connections covered before and cover now are
+        repainted, the rest of the workspace is left alone.
+        """
+        if not self.manager:
+            return
+        edges = []
+        rec = self.manager.sets.get(set_name)
+        if rec is not None and rec.parent is not None:
+            edges.append((set_name, rec.parent))
+        for child_name in self.manager.set_children.get(set_name, ()):
+            edges.append((child_name, set_name))
+        
+        set_widgets = self.set_widgets
+        for key in edges:
+            geom = self._edge_geom.pop(key, None)
+            if geom is not None:
+                self.update(geom[2])
+            child_widget = set_widgets.get(key[0])
+            parent_widget = set_widgets.get(key[1])
+            if child_widget is not None and parent_widget is not None:
+                self.update(_edge_bounds(*(_widget_center(child_widget) + _widget_center(parent_widget))))
+    
+    def _schedule_repaint(self, full=False):
+        """Repaint on the next flush, calls in between fold into it
+        
+        full repaints the whole workspace instead of leaving the repaint
+        to the areas already marked by invalidate_set_edges.
+        """
+        if full:
+            self._full_repaint = True
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+    
+    def _flush_repaint(self):
+        """Move the children of moved parents, then repaint once"""
+        dirty_parents = self._dirty_parents
+        self._dirty_parents = {}
+        full = self._full_repaint
+        self._full_repaint = False
+        for parent_name, old_pos in dirty_parents.items():
+            if self.update_child_widget_positions(parent_name, old_pos):
+                full = True
+        if full:
+            self.update()
+    
+    def _confirm(self, title, text, on_yes):
+        """Ask a yes/no question without blocking, on_yes runs once Yes is chosen"""
+        box = QtWidgets.QMessageBox(
+            QtWidgets.QMessageBox.Question, title, text,
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No, self
+        )
+        box.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        box.finished.connect(partial(self._on_confirm_finished, on_yes))
+        # open() shows the box window modal and returns straight away
+        box.open()
+    
+    def _on_confirm_finished(self, on_yes, result):
+        if result == QtWidgets.QMessageBox.Yes:
+            on_yes()
     
     def delete_widget(self, set_name):
         """Delete a set widget"""
         if set_name in self.set_widgets:
-            widget = self.set_widgets[set_name]
             # Show confirmation dialog
-            result = QtWidgets.QMessageBox.question(
-                self, "Delete Set",
+            self._confirm(
+                "Delete Set",
                 f"Are you sure you want to delete the set '{set_name}'?",
-                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
+                partial(self._delete_set_confirmed, set_name, self.set_widgets[set_name])
             )
-            
-            if result == QtWidgets.QMessageBox.Yes:
-                # Remove from any groups
-                self.remove_set_from_group(set_name)
-                
-                # Remove from manager
-                self.manager.delete_set(set_name)
-                
-                # Remove widget
-                widget.setParent(None)
-                widget.deleteLater()
-                del self.set_widgets[set_name]
-                
-                # Update parent-child visuals
-                self.update_widget_parent_indicators()
+    
+    def _delete_set_confirmed(self, set_name, widget):
+        # The set may have been renamed or removed while the box was open
+        if self.set_widgets.get(set_name) is not widget:
+            return
+        
+        # Remove from any groups
+        self.remove_set_from_group(set_name)
+        
+        # Remove from manager
+        self.manager.delete_set(set_name)
+        
+        # Remove widget
+        widget.setParent(None)
+        widget.deleteLater()
+        del self.set_widgets[set_name]
+        self.sets_revision += 1
+        
+        # Update parent-child visuals
+        self.update_widget_parent_indicators()
     
     def delete_group_widget(self, group_name):
         """Delete a parent group widget"""
         if group_name in self.group_widgets:
-            widget = self.group_widgets[group_name]
             # Show confirmation dialog
-            result = QtWidgets.QMessageBox.question(
-                self, "Delete Group",
+            self._confirm(
+                "Delete Group",
                 f"Are you sure you want to delete the group '{group_name}'?",
-                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
+                partial(self._delete_group_confirmed, group_name, self.group_widgets[group_name])
             )
-            
-            if result == QtWidgets.QMessageBox.Yes:
-                # Remove from manager
-                self.manager.delete_parent_group(group_name)
-                
-                # Remove widget
-                widget.setParent(None)
-                widget.deleteLater()
-                del self.group_widgets[group_name]
+    
+    def _delete_group_confirmed(self, group_name, widget):
+        # The group may have been renamed or removed while the box was open
+        if self.group_widgets.get(group_name) is not widget:
+            return
+        
+        # Remove from manager
+        self.manager.delete_parent_group(group_name)
+        
+        # Remove widget
+        widget.setParent(None)
+        widget.deleteLater()
+        del self.group_widgets[group_name]
+        self.groups_revision += 1
     
     def rename_widget(self, old_name):
         """Rename a set widget"""
@@ -389,6 +626,7 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
                     widget.update_label(new_name)
                     self.set_widgets[new_name] = widget
                     del self.set_widgets[old_name]
+                    self.sets_revision += 1
                     
                     # Update parent-child visuals
                     self.update_widget_parent_indicators()
@@ -409,20 +647,47 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
                     widget.update_label(new_name)
                     self.group_widgets[new_name] = widget
                     del self.group_widgets[old_name]
+                    self.groups_revision += 1
     
     def select_object(self, object_name):
-        """Select a single object"""
-        if cmds.objExists(object_name):
-            # Check if shift key is pressed
-            modifiers = QtWidgets.QApplication.keyboardModifiers()
-            if modifiers == QtCore.Qt.ShiftModifier:
-                # Add to selection
-                cmds.select(object_name, add=True)
+        """Select a single object, clicks in quick succession are selected together"""
+        # Check if shift key is pressed
+        modifiers = QtWidgets.QApplication.keyboardModifiers()
+        if modifiers != QtCore.Qt.ShiftModifier:
+            # Replace selection, earlier pending clicks are superseded
+            self._pending_select.clear()
+            self._pending_select_add = False
+        elif not self._pending_select:
+            # Add to selection
+            self._pending_select_add = True
+        self._pending_select[object_name] = None
+        
+        if not self._select_timer.isActive():
+            self._select_timer.start()
+    
+    def _flush_select(self):
+        """Select the pending clicked objects with one command"""
+        names = list(self._pending_select)
+        self._pending_select.clear()
+        if not names:
+            return
+        
+        # The clicked names are selected as they are, in click order. cmds.ls
+        # only tells whether any of them is gone, it does not keep the order.
+        existing = names
+        if len(cmds.ls(names)) < len(names):
+            existing = []
+            for name in names:
+                if cmds.objExists(name):
+                    existing.append(name)
+                else:
+                    cmds.warning(f"Object '{name}' no longer exists in the scene.")
+        
+        if existing:
+            if self._pending_select_add:
+                cmds.select(existing, add=True)
             else:
-                # Replace selection
-                cmds.select(object_name, replace=True)
-        else:
-            cmds.warning(f"Object '{object_name}' no longer exists in the scene.")
+                cmds.select(existing, replace=True)
     
     def select_set(self, set_name):
         """Select all objects in a set"""
@@ -434,65 +699,128 @@ class SelectionSetWorkspace(QtWidgets.QWidget):
             cmds.warning(f"Image file not found: {image_path}")
             return False
         
-        # Load and scale the image
-        pixmap = QtGui.QPixmap(image_path)
+        # Load the image, decoded once per file version while it stays in
+        # the cache. Imports rewrite the restored image at a fixed path.
+        st = os.stat(image_path)
+        key = f"{image_path}:{st.st_mtime_ns}:{st.st_size}"
+        pixmap = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(key, pixmap):
+            pixmap = QtGui.QPixmap(image_path)
+            if not pixmap.isNull():
+                QtGui.QPixmapCache.insert(key, pixmap)
         if not pixmap.isNull():
             self.background_image = image_path
+            self._bg_cache_key = key
             self.background_pixmap = pixmap
-            self.update()  # Trigger repaint
+            self._rescale_background()
             return True
         return False
+    
+    def _rescale_background(self, transform=QtCore.Qt.SmoothTransformation):
+        """Scale the background to fit the workspace and center it"""
+        if self.background_pixmap:
+            # Smooth scales are shared through the cache per image version
+            # and size, so reopening the manager at the same size does not
+            # rescale
+            smooth = transform == QtCore.Qt.SmoothTransformation
+            key = f"{self._bg_cache_key}@{self.width()}x{self.height()}"
+            scaled = QtGui.QPixmap()
+            if not (smooth and QtGui.QPixmapCache.find(key, scaled)):
+                # Scale image to fit the widget while maintaining aspect ratio
+                scaled = self.background_pixmap.scaled(
+                    self.size(), QtCore.Qt.KeepAspectRatio, transform
+                )
+                if smooth:
+                    QtGui.QPixmapCache.insert(key, scaled)
+            self._scaled_bg = scaled
+            # Center the image
+            self._bg_pos = QtCore.QPoint(
+                (self.width() - self._scaled_bg.width()) // 2,
+                (self.height() - self._scaled_bg.height()) // 2
+            )
+        else:
+            self._scaled_bg = None
+        self.update()  # Trigger repaint
+    
+    def resizeEvent(self, event):
+        """Rescale the background to the new workspace size"""
+        super(SelectionSetWorkspace, self).resizeEvent(event)
+        if self.background_pixmap:
+            self._rescale_background(QtCore.Qt.FastTransformation)
+            self._smooth_bg_timer.start()
         
     def paintEvent(self, event):
         """Paint background and any parent-child connections"""
         painter = QtGui.QPainter(self)
+        # Only the exposed part is drawn, moves repaint just what they touch
+        exposed = event.rect()
         
-        # Draw background image if it exists
-        if self.background_pixmap:
-            # Scale image to fit the widget while maintaining aspect ratio
-            scaled_pixmap = self.background_pixmap.scaled(
-                self.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
-            )
-            # Center the image
-            x = (self.width() - scaled_pixmap.width()) // 2
-            y = (self.height() - scaled_pixmap.height()) // 2
-            painter.drawPixmap(x, y, scaled_pixmap)
+        # Draw background image if it exists, already scaled to the workspace
+        if self._scaled_bg is not None:
+            target = exposed.intersected(QtCore.QRect(self._bg_pos, self._scaled_bg.size()))
+            if not target.isEmpty():
+                painter.drawPixmap(target, self._scaled_bg, target.translated(-self._bg_pos.x(), -self._bg_pos.y()))
         
         # Draw parent-child connections
         if self.manager:
             # Set pen for connections
-            pen = QtGui.QPen(QtGui.QColor(200, 200, 200, 150))
-            pen.setWidth(2)
-            pen.setStyle(QtCore.Qt.DashLine)
-            painter.setPen(pen)
+            painter.setPen(_CONNECTION_PEN)
             
-            # Draw connections
-            for child_name, parent_name in self.manager.set_parents.items():
-                if parent_name and child_name in self.set_widgets and parent_name in self.set_widgets:
-                    child_widget = self.set_widgets[child_name]
-                    parent_widget = self.set_widgets[parent_name]
-                    
-                    # Get center points of widgets
-                    child_center = child_widget.pos() + QtCore.QPoint(child_widget.width() // 2, child_widget.height() // 2)
-                    parent_center = parent_widget.pos() + QtCore.QPoint(parent_widget.width() // 2, parent_widget.height() // 2)
-                    
-                    # Draw the connection line
-                    painter.drawLine(child_center, parent_center)
-                    
-                    # Draw arrow head
-                    arrow_size = 8
-                    angle = math.atan2(child_center.y() - parent_center.y(), 
-                                      child_center.x() - parent_center.x())
-                    arrow_p1 = child_center - QtCore.QPoint(
-                        int(arrow_size * math.cos(angle - math.pi/6)),
-                        int(arrow_size * math.sin(angle - math.pi/6))
-                    )
-                    arrow_p2 = child_center - QtCore.QPoint(
-                        int(arrow_size * math.cos(angle + math.pi/6)),
-                        int(arrow_size * math.sin(angle + math.pi/6))
-                    )
-                    
-                    # Draw arrow head
-                    painter.setBrush(QtGui.QBrush(QtGui.QColor(200, 200, 200, 150)))
-                    arrow = QtGui.QPolygon([child_center, arrow_p1, arrow_p2])
-                    painter.drawPolygon(arrow)
\ No newline at end of file
+            # Collect every connection line and arrow head first, then
+            # draw them with one call each
+            lines = []
+            arrows = QtGui.QPainterPath()
+            
+            # Edge geometry is kept until an endpoint moves or the sets change
+            if self._edge_geom_revision != self.sets_revision:
+                self._edge_geom.clear()
+                self._edge_geom_revision = self.sets_revision
+            edge_geom = self._edge_geom
+            
+            # Walk only the sets that have children, gathering the edges
+            # whose geometry is missing so they are computed together. Each
+            # widget center is read once however many edges it ends.
+            edges = []
+            missing = []
+            missing_centers = []
+            centers = {}
+            set_widgets = self.set_widgets
+            for parent_name, children in self.manager.set_children.items():
+                parent_widget = set_widgets.get(parent_name)
+                if parent_widget is None:
+                    continue
+                parent_center = None
+                for child_name in children:
+                    key = (child_name, parent_name)
+                    if key not in edge_geom:
+                        child_widget = set_widgets.get(child_name)
+                        if child_widget is None:
+                            continue
+                        if parent_center is None:
+                            parent_center = centers.get(parent_name)
+                            if parent_center is None:
+                                parent_center = centers[parent_name] = _widget_center(parent_widget)
+                        child_center = centers.get(child_name)
+                        if child_center is None:
+                            child_center = centers[child_name] = _widget_center(child_widget)
+                        missing.append(key)
+                        missing_centers.append(child_center + parent_center)
+                    edges.append(key)
+            if missing:
+                for key, edge, (line, arrow) in zip(
+                        missing, missing_centers, _edge_geometries(missing_centers)):
+                    edge_geom[key] = (line, arrow, _edge_bounds(*edge))
+            
+            # Skip connections outside the exposed area
+            for key in edges:
+                line, arrow, bounds = edge_geom[key]
+                if not bounds.intersects(exposed):
+                    continue
+                lines.append(line)
+                if arrow is not None:
+                    arrows.addPolygon(arrow)
+            
+            if lines:
+                painter.drawLines(lines)
+                painter.setBrush(_ARROW_BRUSH)
+                painter.drawPath(arrows)